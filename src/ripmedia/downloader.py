@@ -6,8 +6,6 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable
 
-from yt_dlp import YoutubeDL
-
 from .errors import DownloadError
 from .paths import OutputPlan, ensure_unique_path
 from .shared import NoopLogger, apply_cookie_options, image_mime_from_ext, sniff_image_mime
@@ -81,6 +79,8 @@ def download_with_ytdlp(
                 ydl_opts["merge_output_format"] = out_ext
 
         try:
+            from yt_dlp import YoutubeDL
+
             with YoutubeDL(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=True)
         except Exception as e:  # noqa: BLE001
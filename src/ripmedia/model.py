@@ -27,7 +27,7 @@ class Attribution:
     media_source: Provider | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NormalizedItem:
     provider: Provider
     kind: MediaKind
@@ -1,23 +1,34 @@
 from __future__ import annotations
 
-from dataclasses import replace
-from pathlib import Path
-from time import monotonic
-from typing import Callable
+import os
+import re
 import subprocess
 import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from pathlib import Path
+from time import monotonic
+
+from rich.progress import Progress
 
 from .downloader import download_with_ytdlp
 from .errors import DownloadError, MetadataError, PartialSuccessError, RipmediaError
 from .model import Attribution, MediaKind, NormalizedItem, Provider
 from .paths import build_collection_item_plan, build_output_plan, collection_directory
 from .resolver import resolve_candidates
-from .tagger import Artwork, tag_file
-from rich.progress import Progress
-
+from .shared import find_ffmpeg_tool
+from .tagger import Artwork, tag_file, tag_files
 from .ui import LiveProgress, StepResult, Ui
 
 
+@dataclass(frozen=True)
+class _Downloaded:
+    path: Path
+    item: NormalizedItem
+    artwork: Artwork | None
+
+
 def run_info(
     url: str,
     *,
@@ -73,6 +84,16 @@ def _collection_track_number(item: NormalizedItem) -> int | None:
     return item.track_number
 
 
+def _collection_total_label(item: NormalizedItem, entries: Iterable[NormalizedItem]) -> str:
+    if isinstance(entries, list):
+        return str(len(entries))
+    # Streamed entries: fall back to the count yt-dlp reported up front, if any.
+    extra = item.extra if isinstance(item.extra, dict) else {}
+    ytdlp = extra.get("ytdlp")
+    count = ytdlp.get("playlist_count") if isinstance(ytdlp, dict) else None
+    return str(count) if isinstance(count, int) and count > 0 else "?"
+
+
 def run_download(
     url: str,
     *,
@@ -99,7 +120,9 @@ def run_download(
     _tick(live, status_callback, "Metadata")
     meta_start = monotonic()
     try:
-        item = _fetch_metadata(url, cookies=cookies, cookies_from_browser=cookies_from_browser)
+        item, entries = _fetch_metadata_stream(
+            url, cookies=cookies, cookies_from_browser=cookies_from_browser
+        )
     except RipmediaError as e:
         _record_step(live, step_callback, "Metadata", False, str(e), meta_start)
         raise
@@ -112,6 +135,7 @@ def run_download(
     if item.kind in {MediaKind.PLAYLIST, MediaKind.ALBUM}:
         return _run_collection(
             item,
+            entries=entries if entries is not None else item.entries,
             output_dir=output_dir,
             audio=audio,
             override_audio_format=override_audio_format,
@@ -132,7 +156,7 @@ def run_download(
             progress_callback=progress_callback,
         )
 
-    path = _run_single(
+    downloaded = _download_single(
         item,
         output_dir=output_dir,
         audio=audio,
@@ -153,6 +177,15 @@ def run_download(
         step_callback=step_callback,
         progress_callback=progress_callback,
     )
+    path = _finalize_single(
+        downloaded,
+        ui=ui,
+        prefer_mp3_mp4=prefer_mp3_mp4,
+        live=live,
+        show_stage=show_stage,
+        status_callback=status_callback,
+        step_callback=step_callback,
+    )
     if show_stage:
         ui.stage("Saved", ui.path_link(path))
     return [path]
@@ -161,6 +194,7 @@ def run_download(
 def _run_collection(
     item: NormalizedItem,
     *,
+    entries: Iterable[NormalizedItem] | None,
     output_dir: Path,
     audio: bool,
     override_audio_format: str | None,
@@ -180,7 +214,7 @@ def _run_collection(
     step_callback: Callable[[StepResult], None] | None,
     progress_callback: Callable[[dict], None] | None,
 ) -> list[Path]:
-    if not item.entries:
+    if entries is None:
         raise MetadataError("This collection has no entries (or expansion is unsupported).", stage="Metadata")
 
     folder = collection_directory(item, output_dir=output_dir)
@@ -188,9 +222,25 @@ def _run_collection(
 
     saved: list[Path] = []
     failures: list[tuple[str, str, str | None]] = []
+    # mp4 outputs are optimized in one ffmpeg run after all downloads finish.
+    deferred: list[tuple[str, _Downloaded]] = []
 
-    total = len(item.entries)
-    for idx, entry in enumerate(item.entries, start=1):
+    total_label = _collection_total_label(item, entries)
+    total = 0
+    entry_iter = iter(entries)
+    while True:
+        try:
+            entry = next(entry_iter)
+        except StopIteration:
+            break
+        except RipmediaError as e:
+            # Entries stream in while downloads run; keep what is already saved.
+            if total == 0:
+                raise
+            failures.append((item.url, str(e), e.stage))
+            break
+        total += 1
+        idx = total
         working_entry = entry
         parent_album = item.album or item.title
         if parent_album and not working_entry.album:
@@ -201,10 +251,10 @@ def _run_collection(
             working_entry = replace(working_entry, artwork_url=item.artwork_url)
         title = working_entry.title or working_entry.url
         if ui.level != "quiet" and not ui.print_path_only and live is None:
-            ui.info(f"[dim]{idx}/{total}[/dim] {title}")
+            ui.info(f"[dim]{idx}/{total_label}[/dim] {title}")
         collection_index = _collection_track_number(working_entry)
         try:
-            saved_path = _run_single(
+            downloaded = _download_single(
                 working_entry,
                 output_dir=folder,
                 audio=audio,
@@ -227,7 +277,20 @@ def _run_collection(
                 step_callback=step_callback,
                 progress_callback=progress_callback,
             )
-            saved.append(saved_path)
+            if prefer_mp3_mp4 and downloaded.path.suffix.lower() == ".mp4":
+                deferred.append((entry.url, downloaded))
+                continue
+            saved.append(
+                _finalize_single(
+                    downloaded,
+                    ui=ui,
+                    prefer_mp3_mp4=prefer_mp3_mp4,
+                    live=live,
+                    show_stage=show_stage,
+                    status_callback=status_callback,
+                    step_callback=step_callback,
+                )
+            )
         except RipmediaError as e:
             failures.append((entry.url, str(e), e.stage))
             continue
@@ -235,6 +298,56 @@ def _run_collection(
             failures.append((entry.url, str(e), None))
             continue
 
+    if deferred:
+        optimize_start = monotonic()
+        label = "Optimize mp4"
+        _tick(live, status_callback, label)
+        if show_stage:
+            ui.stage("Post-process", label)
+        errors = _ensure_playable_mp4_many([d.path for _, d in deferred])
+        failed = [e for e in errors if e is not None]
+        detail = f"{len(failed)}/{len(deferred)} failed" if failed else None
+        _record_step(live, step_callback, label, not failed, detail, optimize_start)
+        ready: list[tuple[str, _Downloaded]] = []
+        for (entry_url, downloaded), error in zip(deferred, errors, strict=True):
+            if error is not None:
+                failures.append((entry_url, str(error), error.stage))
+            else:
+                ready.append((entry_url, downloaded))
+        if ready:
+            tag_start = monotonic()
+            _tick(live, status_callback, "Tagging")
+            if show_stage:
+                ui.stage("Tagging", None)
+            results = tag_files([(d.path, d.item, d.artwork) for _, d in ready])
+            skipped = [r for r in results if isinstance(r, RipmediaError)]
+            for e in skipped:
+                ui.verbose(f"Tagging skipped/failed: {e}")
+            detail = f"{len(skipped)}/{len(ready)} skipped" if skipped else None
+            _record_step(live, step_callback, "Tagging", True, detail, tag_start)
+        for entry_url, downloaded in ready:
+            try:
+                saved.append(
+                    _finalize_single(
+                        downloaded,
+                        ui=ui,
+                        prefer_mp3_mp4=prefer_mp3_mp4,
+                        live=live,
+                        show_stage=show_stage,
+                        status_callback=status_callback,
+                        step_callback=step_callback,
+                        optimize=False,
+                        tag=False,
+                    )
+                )
+            except Exception as e:  # noqa: BLE001
+                failures.append((entry_url, str(e), None))
+
+    if total == 0 and not failures:
+        raise MetadataError(
+            "This collection has no entries (or expansion is unsupported).", stage="Metadata"
+        )
+
     if failures and saved:
         if show_stage:
             ui.stage("Saved", ui.path_link(folder))
@@ -251,7 +364,7 @@ def _run_collection(
     return saved
 
 
-def _run_single(
+def _download_single(
     item: NormalizedItem,
     *,
     output_dir: Path,
@@ -274,7 +387,7 @@ def _run_single(
     status_callback: Callable[[str], None] | None,
     step_callback: Callable[[StepResult], None] | None,
     progress_callback: Callable[[dict], None] | None,
-) -> Path:
+) -> _Downloaded:
     download_url = item.url
     working_item = item
     if item.provider == Provider.SPOTIFY and item.kind == MediaKind.TRACK:
@@ -393,12 +506,12 @@ def _run_single(
         if status == "downloading":
             filename = d.get("filename")
             if filename:
-                try:
-                    name = Path(str(filename)).name
-                    if name:
+                name = os.path.basename(os.fsdecode(filename))
+                if name:
+                    try:
                         progress.update(task_id, description=name[:80])
-                except Exception:  # noqa: BLE001
-                    pass
+                    except Exception:  # noqa: BLE001
+                        pass
             if step_label and step_label not in download_steps_started:
                 download_steps_started[step_label] = monotonic()
                 _tick(live, status_callback, f"{step_label}: {display_name[:40]}")
@@ -491,40 +604,55 @@ def _run_single(
     if own_progress:
         progress.stop()
 
-    if prefer_mp3_mp4 and result.downloaded_path.suffix.lower() == ".mp4":
+    artwork_override = None
+    if result.artwork_bytes:
+        artwork_override = Artwork(bytes=result.artwork_bytes, mime=result.artwork_mime)
+    return _Downloaded(path=result.downloaded_path, item=working_item, artwork=artwork_override)
+
+
+def _finalize_single(
+    downloaded: _Downloaded,
+    *,
+    ui: Ui,
+    prefer_mp3_mp4: bool,
+    live: LiveProgress | None,
+    show_stage: bool,
+    status_callback: Callable[[str], None] | None,
+    step_callback: Callable[[StepResult], None] | None,
+    optimize: bool = True,
+    tag: bool = True,
+) -> Path:
+    path = downloaded.path
+    if optimize and prefer_mp3_mp4 and path.suffix.lower() == ".mp4":
         optimize_start = monotonic()
         label = "Optimize mp4"
         _tick(live, status_callback, label)
         if show_stage:
             ui.stage("Post-process", label)
         try:
-            safe_path = _ensure_playable_mp4(result.downloaded_path)
-            if safe_path != result.downloaded_path:
-                result = replace(result, downloaded_path=safe_path)
+            path = _ensure_playable_mp4(path)
             _record_step(live, step_callback, label, True, None, optimize_start)
         except RipmediaError as e:
             _record_step(live, step_callback, label, False, str(e), optimize_start)
             raise
 
-    if show_stage:
-        ui.stage("Tagging", None)
-    try:
-        tag_start = monotonic()
-        _tick(live, status_callback, "Tagging")
-        artwork_override = None
-        if result.artwork_bytes:
-            artwork_override = Artwork(bytes=result.artwork_bytes, mime=result.artwork_mime)
-        tag_file(result.downloaded_path, working_item, artwork_override=artwork_override)
-        _record_step(live, step_callback, "Tagging", True, None, tag_start)
-    except RipmediaError as e:
-        ui.verbose(f"Tagging skipped/failed: {e}")
-        _record_step(live, step_callback, "Tagging", True, "skipped", tag_start)
-    saved_step = StepResult(label="Saved", ok=True, detail=ui.path_link(result.downloaded_path))
+    if tag:
+        if show_stage:
+            ui.stage("Tagging", None)
+        try:
+            tag_start = monotonic()
+            _tick(live, status_callback, "Tagging")
+            tag_file(path, downloaded.item, artwork_override=downloaded.artwork)
+            _record_step(live, step_callback, "Tagging", True, None, tag_start)
+        except RipmediaError as e:
+            ui.verbose(f"Tagging skipped/failed: {e}")
+            _record_step(live, step_callback, "Tagging", True, "skipped", tag_start)
+    saved_step = StepResult(label="Saved", ok=True, detail=ui.path_link(path))
     if live is not None:
         live.add_result(saved_step)
     if step_callback is not None:
         step_callback(saved_step)
-    return result.downloaded_path
+    return path
 
 
 def _record_step(
@@ -566,6 +694,7 @@ def _download_step_label(info: dict) -> str | None:
     return None
 
 
+@lru_cache(maxsize=64)
 def _postprocess_label(name: str | None) -> str:
     if not name:
         return "Post-process"
@@ -585,31 +714,138 @@ def _postprocess_label(name: str | None) -> str:
     return _split_camel(name)
 
 
+_CAMEL_RE = re.compile(r"(?<=[a-z])(?=[A-Z])")
+
+
 def _split_camel(text: str) -> str:
-    if not text:
-        return text
-    out: list[str] = [text[0]]
-    for prev, ch in zip(text, text[1:]):
-        if ch.isupper() and prev.islower():
-            out.append(" ")
-        out.append(ch)
-    return "".join(out)
+    return _CAMEL_RE.sub(" ", text) if text else text
+
+
+_FASTSTART_ARGS = ("-c", "copy", "-movflags", "+faststart")
+_TRANSCODE_ARGS = (
+    "-c:v",
+    "libx264",
+    "-pix_fmt",
+    "yuv420p",
+    "-profile:v",
+    "high",
+    "-level",
+    "4.1",
+    "-c:a",
+    "aac",
+    "-b:a",
+    "192k",
+    "-movflags",
+    "+faststart",
+)
 
 
 def _ensure_playable_mp4(path: Path) -> Path:
-    video_codec, audio_codec = _probe_codecs(path)
-    needs_transcode = video_codec != "h264" or (audio_codec not in (None, "aac"))
-    if needs_transcode:
+    if _needs_transcode(path):
         return _ffmpeg_transcode_mp4(path)
+    if _is_faststart(path):
+        return path
     return _ffmpeg_faststart(path)
 
 
+# Inputs per shared ffmpeg process; keeps argv length and open files bounded.
+_REMUX_BATCH_SIZE = 16
+
+
+def _ensure_playable_mp4_many(paths: list[Path]) -> list[RipmediaError | None]:
+    """Optimize several mp4 files, sharing one ffmpeg process per codec path.
+
+    Returns one entry per input path: ``None`` on success, otherwise the error.
+    """
+    if len(paths) == 1:
+        try:
+            _ensure_playable_mp4(paths[0])
+        except RipmediaError as e:
+            return [e]
+        except OSError as e:
+            return [DownloadError(str(e), stage="Post-process")]
+        return [None]
+
+    errors: list[RipmediaError | None] = [None] * len(paths)
+    faststart: list[int] = []
+    transcode: list[int] = []
+    for idx, path in enumerate(paths):
+        if _needs_transcode(path):
+            transcode.append(idx)
+        elif not _is_faststart(path):
+            faststart.append(idx)
+
+    batches = (
+        (faststart, _FASTSTART_ARGS, _ffmpeg_faststart),
+        (transcode, _TRANSCODE_ARGS, _ffmpeg_transcode_mp4),
+    )
+    for indexes, codec_args, run_one in batches:
+        for start in range(0, len(indexes), _REMUX_BATCH_SIZE):
+            chunk = indexes[start : start + _REMUX_BATCH_SIZE]
+            if len(chunk) > 1:
+                try:
+                    _ffmpeg_remux_many([paths[i] for i in chunk], codec_args)
+                    continue
+                except (RipmediaError, OSError):
+                    # One bad input fails the whole batch; retry individually to isolate it.
+                    pass
+            for i in chunk:
+                try:
+                    run_one(paths[i])
+                except RipmediaError as e:
+                    errors[i] = e
+                except OSError as e:
+                    errors[i] = DownloadError(str(e), stage="Post-process")
+    return errors
+
+
+def _is_faststart(path: Path) -> bool:
+    """Return True when the top-level ``moov`` box precedes ``mdat``."""
+    try:
+        with path.open("rb") as f:
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    return False
+                size = int.from_bytes(header[:4], "big")
+                box = header[4:]
+                if box == b"moov":
+                    return True
+                if box == b"mdat":
+                    return False
+                if size == 1:
+                    large = f.read(8)
+                    if len(large) < 8:
+                        return False
+                    size = int.from_bytes(large, "big") - 16
+                    if size < 0:
+                        return False
+                elif size >= 8:
+                    size -= 8
+                else:
+                    # size 0 means "extends to end of file"; anything smaller is malformed.
+                    return False
+                f.seek(size, 1)
+    except OSError:
+        return False
+
+
+def _needs_transcode(path: Path) -> bool:
+    video_codec, audio_codec = _probe_codecs(path)
+    return video_codec != "h264" or (audio_codec not in (None, "aac"))
+
+
 def _probe_codecs(path: Path) -> tuple[str | None, str | None]:
+    ffprobe = find_ffmpeg_tool("ffprobe")
+    if ffprobe is None:
+        return None, None
+    spath = os.fspath(path)
+
     def _probe(stream: str) -> str | None:
         try:
             proc = subprocess.run(
                 [
-                    "ffprobe",
+                    ffprobe,
                     "-v",
                     "error",
                     "-select_streams",
@@ -618,7 +854,7 @@ def _probe_codecs(path: Path) -> tuple[str | None, str | None]:
                     "stream=codec_name",
                     "-of",
                     "default=nk=1:nw=1",
-                    str(path),
+                    spath,
                 ],
                 capture_output=True,
                 text=True,
@@ -638,21 +874,11 @@ def _probe_codecs(path: Path) -> tuple[str | None, str | None]:
 
 def _ffmpeg_faststart(path: Path) -> Path:
     tmp_path = _temp_sibling(path)
-    args = [
-        "ffmpeg",
-        "-y",
-        "-i",
-        str(path),
-        "-map",
-        "0:v:0",
-        "-map",
-        "0:a:0?",
-        "-c",
-        "copy",
-        "-movflags",
-        "+faststart",
-        str(tmp_path),
-    ]
+    spath = os.fspath(path)
+    tpath = os.fspath(tmp_path)
+    args = ["-y", "-i", spath, "-map", "0:v:0", "-map", "0:a:0?"]
+    args.extend(_FASTSTART_ARGS)
+    args.append(tpath)
     _run_ffmpeg(args, stage="Post-process")
     tmp_path.replace(path)
     return path
@@ -660,40 +886,56 @@ def _ffmpeg_faststart(path: Path) -> Path:
 
 def _ffmpeg_transcode_mp4(path: Path) -> Path:
     tmp_path = _temp_sibling(path)
-    args = [
-        "ffmpeg",
-        "-y",
-        "-i",
-        str(path),
-        "-map",
-        "0:v:0",
-        "-map",
-        "0:a:0?",
-        "-c:v",
-        "libx264",
-        "-pix_fmt",
-        "yuv420p",
-        "-profile:v",
-        "high",
-        "-level",
-        "4.1",
-        "-c:a",
-        "aac",
-        "-b:a",
-        "192k",
-        "-movflags",
-        "+faststart",
-        str(tmp_path),
-    ]
+    spath = os.fspath(path)
+    tpath = os.fspath(tmp_path)
+    args = ["-y", "-i", spath, "-map", "0:v:0", "-map", "0:a:0?"]
+    args.extend(_TRANSCODE_ARGS)
+    args.append(tpath)
     _run_ffmpeg(args, stage="Post-process")
     tmp_path.replace(path)
     return path
 
 
+def _ffmpeg_remux_many(paths: list[Path], codec_args: tuple[str, ...]) -> None:
+    tmp_paths = [_temp_sibling(p) for p in paths]
+    args = ["-y"]
+    for path in paths:
+        args.extend(["-i", os.fspath(path)])
+    for idx, tmp_path in enumerate(tmp_paths):
+        args.extend(
+            [
+                "-map",
+                f"{idx}:v:0",
+                "-map",
+                f"{idx}:a:0?",
+                "-map_metadata",
+                str(idx),
+                "-map_chapters",
+                str(idx),
+            ]
+        )
+        args.extend(codec_args)
+        args.append(os.fspath(tmp_path))
+    try:
+        _run_ffmpeg(args, stage="Post-process")
+    except (RipmediaError, OSError):
+        for tmp_path in tmp_paths:
+            tmp_path.unlink(missing_ok=True)
+        raise
+    for path, tmp_path in zip(paths, tmp_paths, strict=True):
+        tmp_path.replace(path)
+
+
 def _run_ffmpeg(args: list[str], *, stage: str) -> None:
+    """Run ffmpeg with ``args`` (everything after the executable)."""
+    ffmpeg = find_ffmpeg_tool("ffmpeg")
+    if ffmpeg is None:
+        raise DownloadError(
+            "ffmpeg not found. Install ffmpeg and ensure it's on PATH.", stage=stage
+        )
     try:
         proc = subprocess.run(
-            args,
+            [ffmpeg, *args],
             capture_output=True,
             text=True,
             encoding="utf-8",
@@ -712,6 +954,27 @@ def _temp_sibling(path: Path) -> Path:
         return Path(tmp.name)
 
 
+def _fetch_metadata_stream(
+    url: str,
+    *,
+    cookies: Path | None = None,
+    cookies_from_browser: str | None = None,
+) -> tuple[NormalizedItem, Iterator[NormalizedItem] | None]:
+    from .providers.detect import detect_provider
+    from .providers.spotify import fetch_spotify_metadata
+    from .providers.ytdlp_metadata import stream_ytdlp_metadata
+
+    provider = detect_provider(url)
+    if provider == Provider.SPOTIFY:
+        return fetch_spotify_metadata(url), None
+    return stream_ytdlp_metadata(
+        url,
+        provider=provider,
+        cookies=cookies,
+        cookies_from_browser=cookies_from_browser,
+    )
+
+
 def _fetch_metadata(
     url: str,
     *,
@@ -1,19 +1,28 @@
 from __future__ import annotations
 
 import importlib.util
+import os
 import sys
 from dataclasses import dataclass, field
+from importlib.machinery import SourceFileLoader
 from pathlib import Path
 from types import ModuleType
-from typing import Any, Callable
-
-import typer
+from typing import TYPE_CHECKING, Any, Callable
 
 from .config import get_config_path, load_config
-from .ui import Ui
-from rich.console import Console
+
+if TYPE_CHECKING:
+    import typer
+
+    from .ui import Ui
+
+
+# (path, mtime_ns, parsed config) of the last config file read by PluginAPI.get_config.
+_CONFIG_CACHE: tuple[Path, int, dict[str, str]] | None = None
 
 
+# Plugin-facing classes deliberately have no __slots__: plugins may set their own
+# attributes on them.
 @dataclass
 class HookContext:
     event: str
@@ -55,6 +64,8 @@ class PluginRegistry:
 
 class PluginAPI:
     def __init__(self, info: PluginInfo, registry: PluginRegistry) -> None:
+        import typer
+
         self.info = info
         self.registry = registry
         self.app = typer.Typer(add_completion=False, help=f"{info.name} plugin")
@@ -70,9 +81,23 @@ class PluginAPI:
         return decorator
 
     def get_config(self) -> dict[str, str]:
-        return load_config(get_config_path())
+        global _CONFIG_CACHE
+        path = get_config_path()
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            return {}
+        cached = _CONFIG_CACHE
+        if cached is None or cached[0] != path or cached[1] != mtime:
+            cached = (path, mtime, load_config(path))
+            _CONFIG_CACHE = cached
+        return dict(cached[2])
 
     def make_ui(self, *, no_color: bool = False, speed_unit: str = "MBps") -> Ui:
+        from rich.console import Console
+
+        from .ui import Ui
+
         console = Console(no_color=no_color, highlight=False, soft_wrap=True)
         return Ui(console=console, level="normal", print_path_only=False, speed_unit=speed_unit)
 
@@ -83,23 +108,24 @@ def get_plugin_dir() -> Path:
 
 def discover_plugins() -> list[PluginInfo]:
     root = get_plugin_dir()
-    if not root.exists():
+    try:
+        with os.scandir(root) as it:
+            entries = sorted(
+                (e for e in it if e.name.endswith(".py") and e.is_file()),
+                key=lambda e: e.name,
+            )
+    except OSError:
         return []
     plugins: list[PluginInfo] = []
-    for path in sorted(root.glob("*.py")):
-        name = path.stem
-        enabled = True
-        if name.endswith(".disabled"):
-            name = name[: -len(".disabled")]
+    for entry in entries:
+        if entry.name.endswith(".disabled.py"):
+            name = entry.name[: -len(".disabled.py")]
             enabled = False
-        plugins.append(PluginInfo(name=name, path=path, enabled=enabled))
-    for path in sorted(root.glob("*.disabled.py")):
-        name = path.name[:-len(".disabled.py")]
-        plugins.append(PluginInfo(name=name, path=path, enabled=False))
-    dedup: dict[str, PluginInfo] = {}
-    for info in plugins:
-        dedup.setdefault(info.path.name, info)
-    return list(dedup.values())
+        else:
+            name = entry.name[: -len(".py")]
+            enabled = True
+        plugins.append(PluginInfo(name=name, path=Path(entry.path), enabled=enabled))
+    return plugins
 
 
 def load_plugins() -> PluginRegistry:
@@ -127,10 +153,21 @@ def load_plugins() -> PluginRegistry:
 
 def _load_module(info: PluginInfo) -> ModuleType:
     module_name = f"ripmedia_user_plugin_{info.name}"
-    spec = importlib.util.spec_from_file_location(module_name, info.path)
+    modules = sys.modules
+    cached = modules.get(module_name)
+    if cached is not None:
+        return cached
+    # discover_plugins only yields .py files, so the source loader is known up front.
+    loader = SourceFileLoader(module_name, str(info.path))
+    spec = importlib.util.spec_from_file_location(module_name, info.path, loader=loader)
     if spec is None or spec.loader is None:
         raise RuntimeError("Unable to load plugin")
     module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
-    spec.loader.exec_module(module)
+    modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        # Don't leave a half-initialized module behind for the next load to reuse.
+        modules.pop(module_name, None)
+        raise
     return module
@@ -1,44 +1,44 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from urllib.parse import urlparse
 
 from ..model import Provider
 
+_HOSTS: dict[Provider, tuple[str, ...]] = {
+    Provider.YOUTUBE: ("youtu.be", "youtube.com", "music.youtube.com", "youtube-nocookie.com"),
+    Provider.SOUNDCLOUD: ("soundcloud.com", "on.soundcloud.com"),
+    Provider.SPOTIFY: ("open.spotify.com",),
+    Provider.TWITTER: ("twitter.com", "x.com", "vxtwitter.com", "fxtwitter.com"),
+    Provider.PORNHUB: ("pornhub.com",),
+}
 
+# Hostnames are matched after stripping one of these subdomain prefixes.
+_HOST_PREFIXES = ("www.", "m.", "mobile.")
+
+_HOST_TABLE: dict[str, Provider] = {
+    host: provider for provider, hosts in _HOSTS.items() for host in hosts
+}
+
+
+def split_host_path(url: str) -> tuple[str, str]:
+    """Return the lowercased hostname and the path of ``url``.
+
+    Plain string splitting is enough for the absolute http(s) URLs we see; anything
+    without a scheme goes through ``urlparse``.
+    """
+    if "://" not in url:
+        parsed = urlparse(url)
+        return (parsed.hostname or "").lower(), parsed.path
+    rest = url.split("://", 1)[1].split("#", 1)[0].split("?", 1)[0]
+    netloc, sep, path = rest.partition("/")
+    host = netloc.rpartition("@")[2].split(":", 1)[0].lower()
+    return host, sep + path
+
+
+@lru_cache(maxsize=4096)
 def detect_provider(url: str) -> Provider:
-    host = (urlparse(url).hostname or "").lower()
-    if host in {
-        "youtu.be",
-        "www.youtube.com",
-        "youtube.com",
-        "m.youtube.com",
-        "music.youtube.com",
-        "youtube-nocookie.com",
-        "www.youtube-nocookie.com",
-    }:
-        return Provider.YOUTUBE
-    if host in {
-        "soundcloud.com",
-        "www.soundcloud.com",
-        "m.soundcloud.com",
-        "on.soundcloud.com",
-    }:
-        return Provider.SOUNDCLOUD
-    if host in {"open.spotify.com"}:
-        return Provider.SPOTIFY
-    if host in {
-        "twitter.com",
-        "www.twitter.com",
-        "mobile.twitter.com",
-        "x.com",
-        "www.x.com",
-        "mobile.x.com",
-        "vxtwitter.com",
-        "www.vxtwitter.com",
-        "fxtwitter.com",
-        "www.fxtwitter.com",
-    }:
-        return Provider.TWITTER
-    if host in {"pornhub.com", "www.pornhub.com", "m.pornhub.com"}:
-        return Provider.PORNHUB
-    return Provider.UNKNOWN
+    host, _ = split_host_path(url)
+    if host.startswith(_HOST_PREFIXES):
+        host = host[host.index(".") + 1 :]
+    return _HOST_TABLE.get(host, Provider.UNKNOWN)
@@ -1,16 +1,26 @@
 from __future__ import annotations
 
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
-from urllib.parse import urlparse
 
 import requests
 
 from ..errors import MetadataError
 from ..model import Attribution, MediaKind, NormalizedItem, Provider
+from .detect import split_host_path
 
+# Concurrent requests against the Spotify Web API when paging or bulk-fetching tracks.
+_MAX_WORKERS = 8
 
-@dataclass(frozen=True)
+# ((client_id, client_secret), spotipy client) shared by all metadata fetches.
+_CLIENT: tuple[tuple[str, str], Any] | None = None
+_CLIENT_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
 class SpotifyRef:
     kind: MediaKind
     id: str
@@ -18,8 +28,8 @@ class SpotifyRef:
 
 
 def parse_spotify_url(url: str) -> SpotifyRef:
-    parsed = urlparse(url)
-    parts = [p for p in parsed.path.split("/") if p]
+    _, path = split_host_path(url)
+    parts = [p for p in path.split("/") if p]
     if len(parts) < 2:
         raise MetadataError("Unrecognized Spotify URL.", stage="Detected")
     kind_s, id_s = parts[0], parts[1]
@@ -52,24 +62,21 @@ def _fetch_via_spotipy(ref: SpotifyRef) -> NormalizedItem | None:
         if not client_id or not client_secret:
             return None
 
-        import spotipy
-        from spotipy.oauth2 import SpotifyClientCredentials
-
-        sp = spotipy.Spotify(
-            auth_manager=SpotifyClientCredentials(client_id=client_id, client_secret=client_secret)
-        )
+        sp = _spotify_client(client_id, client_secret)
 
         if ref.kind == MediaKind.TRACK:
             data = sp.track(ref.id)
-            album = data.get("album") or {}
+            album = data.get("album")
+            if not isinstance(album, dict):
+                album = {}
             artists = data.get("artists") or []
             artist = (artists[0].get("name") if artists else None) or None
-            images = (album.get("images") or []) if isinstance(album, dict) else []
+            images = album.get("images") or []
             artwork = images[0]["url"] if images else None
-            release_date = (album.get("release_date") if isinstance(album, dict) else None) or None
+            release_date = album.get("release_date") or None
             year = int(release_date.split("-")[0]) if release_date else None
             duration_ms = data.get("duration_ms")
-            isrc = ((data.get("external_ids") or {}).get("isrc")) if isinstance(data, dict) else None
+            isrc = (data.get("external_ids") or {}).get("isrc")
             return NormalizedItem(
                 provider=Provider.SPOTIFY,
                 kind=MediaKind.TRACK,
@@ -77,7 +84,7 @@ def _fetch_via_spotipy(ref: SpotifyRef) -> NormalizedItem | None:
                 url=ref.url,
                 title=data.get("name"),
                 artist=artist,
-                album=(album.get("name") if isinstance(album, dict) else None),
+                album=album.get("name"),
                 track_number=data.get("track_number"),
                 disc_number=data.get("disc_number"),
                 year=year,
@@ -98,6 +105,34 @@ def _fetch_via_spotipy(ref: SpotifyRef) -> NormalizedItem | None:
     return None
 
 
+def _spotify_client(client_id: str, client_secret: str) -> Any:
+    """Return a process-wide spotipy client for these credentials.
+
+    Reusing it keeps the OAuth token (refreshed by spotipy when it expires) and the
+    pooled HTTP connections across calls.
+    """
+    global _CLIENT
+    cached = _CLIENT
+    if cached is not None and cached[0] == (client_id, client_secret):
+        return cached[1]
+    with _CLIENT_LOCK:
+        if _CLIENT is not None and _CLIENT[0] == (client_id, client_secret):
+            return _CLIENT[1]
+
+        import spotipy
+        from spotipy.oauth2 import SpotifyClientCredentials
+
+        session = requests.Session()
+        sp = spotipy.Spotify(
+            auth_manager=SpotifyClientCredentials(
+                client_id=client_id, client_secret=client_secret, requests_session=session
+            ),
+            requests_session=session,
+        )
+        _CLIENT = ((client_id, client_secret), sp)
+        return sp
+
+
 def _fetch_album(sp: Any, ref: SpotifyRef) -> NormalizedItem:
     data = sp.album(ref.id)
     title = data.get("name")
@@ -108,41 +143,39 @@ def _fetch_album(sp: Any, ref: SpotifyRef) -> NormalizedItem:
     release_date = data.get("release_date")
     year = int(release_date.split("-")[0]) if release_date else None
 
+    raw_tracks = _fetch_all_items(
+        sp, lambda offset: sp.album_tracks(ref.id, limit=50, offset=offset), limit=50
+    )
+    isrcs = _fetch_isrcs(sp, [t.get("id") for t in raw_tracks])
+
     tracks: list[NormalizedItem] = []
-    page = sp.album_tracks(ref.id, limit=50, offset=0)
-    while True:
-        for t in page.get("items") or []:
-            if not isinstance(t, dict):
-                continue
-            tid = t.get("id")
-            if not tid:
-                continue
-            t_artists = t.get("artists") or []
-            t_artist = (t_artists[0].get("name") if t_artists else None) or artist
-            duration_ms = t.get("duration_ms")
-            track_url = f"https://open.spotify.com/track/{tid}"
-            tracks.append(
-                NormalizedItem(
-                    provider=Provider.SPOTIFY,
-                    kind=MediaKind.TRACK,
-                    id=tid,
-                    url=track_url,
-                    title=t.get("name"),
-                    artist=t_artist,
-                    album=title,
-                    track_number=t.get("track_number"),
-                    disc_number=t.get("disc_number"),
-                    year=year,
-                    date=release_date,
-                    duration_seconds=int(duration_ms / 1000) if duration_ms else None,
-                    artwork_url=artwork,
-                    attribution=Attribution(metadata_source=Provider.SPOTIFY),
-                )
+    for t in raw_tracks:
+        tid = t.get("id")
+        if not tid:
+            continue
+        t_artists = t.get("artists") or []
+        t_artist = (t_artists[0].get("name") if t_artists else None) or artist
+        duration_ms = t.get("duration_ms")
+        track_url = f"https://open.spotify.com/track/{tid}"
+        tracks.append(
+            NormalizedItem(
+                provider=Provider.SPOTIFY,
+                kind=MediaKind.TRACK,
+                id=tid,
+                url=track_url,
+                title=t.get("name"),
+                artist=t_artist,
+                album=title,
+                track_number=t.get("track_number"),
+                disc_number=t.get("disc_number"),
+                year=year,
+                date=release_date,
+                duration_seconds=int(duration_ms / 1000) if duration_ms else None,
+                artwork_url=artwork,
+                attribution=Attribution(metadata_source=Provider.SPOTIFY),
+                extra={"spotify": {"isrc": isrcs.get(tid)}},
             )
-        next_url = page.get("next")
-        if not next_url:
-            break
-        page = sp.next(page)
+        )
 
     return NormalizedItem(
         provider=Provider.SPOTIFY,
@@ -167,52 +200,56 @@ def _fetch_playlist(sp: Any, ref: SpotifyRef) -> NormalizedItem:
     images = data.get("images") or []
     artwork = images[0]["url"] if images else None
 
+    raw_items = _fetch_all_items(
+        sp,
+        lambda offset: sp.playlist_items(
+            ref.id, limit=100, offset=offset, additional_types=("track",)
+        ),
+        limit=100,
+    )
+
     tracks: list[NormalizedItem] = []
-    page = sp.playlist_items(ref.id, limit=100, offset=0, additional_types=("track",))
     index = 0
-    while True:
-        for it in page.get("items") or []:
-            track = (it or {}).get("track") if isinstance(it, dict) else None
-            if not isinstance(track, dict):
-                continue
-            tid = track.get("id")
-            if not tid:
-                continue
-            index += 1
-            t_artists = track.get("artists") or []
-            artist = (t_artists[0].get("name") if t_artists else None) or None
-            album = track.get("album") or {}
-            album_name = album.get("name") if isinstance(album, dict) else None
-            release_date = album.get("release_date") if isinstance(album, dict) else None
-            year = int(release_date.split("-")[0]) if release_date else None
-            duration_ms = track.get("duration_ms")
-            images = album.get("images") if isinstance(album, dict) else None
-            t_artwork = (images[0]["url"] if images else None) or artwork
-            isrc = ((track.get("external_ids") or {}).get("isrc")) if isinstance(track, dict) else None
-            track_url = f"https://open.spotify.com/track/{tid}"
-            tracks.append(
-                NormalizedItem(
-                    provider=Provider.SPOTIFY,
-                    kind=MediaKind.TRACK,
-                    id=tid,
-                    url=track_url,
-                    title=track.get("name"),
-                    artist=artist,
-                    album=album_name,
-                    track_number=track.get("track_number"),
-                    disc_number=track.get("disc_number"),
-                    year=year,
-                    date=release_date,
-                    duration_seconds=int(duration_ms / 1000) if duration_ms else None,
-                    artwork_url=t_artwork,
-                    attribution=Attribution(metadata_source=Provider.SPOTIFY),
-                    extra={"spotify": {"isrc": isrc}, "playlist_index": index},
-                )
+    for it in raw_items:
+        track = it.get("track")
+        if not track:
+            continue
+        tid = track.get("id")
+        if not tid:
+            continue
+        index += 1
+        t_artists = track.get("artists") or []
+        artist = (t_artists[0].get("name") if t_artists else None) or None
+        album = track.get("album")
+        if not isinstance(album, dict):
+            album = {}
+        album_name = album.get("name")
+        release_date = album.get("release_date")
+        year = int(release_date.split("-")[0]) if release_date else None
+        duration_ms = track.get("duration_ms")
+        images = album.get("images")
+        t_artwork = (images[0]["url"] if images else None) or artwork
+        isrc = (track.get("external_ids") or {}).get("isrc")
+        track_url = f"https://open.spotify.com/track/{tid}"
+        tracks.append(
+            NormalizedItem(
+                provider=Provider.SPOTIFY,
+                kind=MediaKind.TRACK,
+                id=tid,
+                url=track_url,
+                title=track.get("name"),
+                artist=artist,
+                album=album_name,
+                track_number=track.get("track_number"),
+                disc_number=track.get("disc_number"),
+                year=year,
+                date=release_date,
+                duration_seconds=int(duration_ms / 1000) if duration_ms else None,
+                artwork_url=t_artwork,
+                attribution=Attribution(metadata_source=Provider.SPOTIFY),
+                extra={"spotify": {"isrc": isrc}, "playlist_index": index},
             )
-        next_url = page.get("next")
-        if not next_url:
-            break
-        page = sp.next(page)
+        )
 
     return NormalizedItem(
         provider=Provider.SPOTIFY,
@@ -227,6 +264,59 @@ def _fetch_playlist(sp: Any, ref: SpotifyRef) -> NormalizedItem:
     )
 
 
+def _fetch_all_items(sp: Any, fetch_page: Callable[[int], Any], *, limit: int) -> list[Any]:
+    """Fetch every item of a paged endpoint, requesting the remaining pages concurrently.
+
+    The first page tells us ``total``; all other offsets are then known up front. If
+    ``total`` is missing we fall back to following ``next`` links one by one. Shapes
+    are checked here, per page, so callers can treat every item as a dict.
+    """
+    first = fetch_page(0)
+    pages = [first]
+    total = first.get("total")
+    if isinstance(total, int):
+        offsets = range(limit, total, limit)
+        if offsets:
+            with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+                pages.extend(executor.map(fetch_page, offsets))
+    else:
+        page = first
+        while page.get("next"):
+            page = sp.next(page)
+            pages.append(page)
+    items: list[Any] = []
+    for page in pages:
+        page_items = page.get("items")
+        if isinstance(page_items, list):
+            items.extend(it for it in page_items if isinstance(it, dict))
+    return items
+
+
+def _fetch_isrcs(sp: Any, track_ids: list[str | None]) -> dict[str, str]:
+    """Look up ISRCs for album tracks via the bulk tracks endpoint (50 ids per call).
+
+    Album track listings omit ``external_ids``; the ISRC only improves resolver
+    matching, so failures here are ignored.
+    """
+    ids = [tid for tid in track_ids if tid]
+    chunks = [ids[i : i + 50] for i in range(0, len(ids), 50)]
+    if not chunks:
+        return {}
+    isrcs: dict[str, str] = {}
+    try:
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            for resp in executor.map(sp.tracks, chunks):
+                for track in (resp or {}).get("tracks") or []:
+                    if not isinstance(track, dict):
+                        continue
+                    isrc = (track.get("external_ids") or {}).get("isrc")
+                    if track.get("id") and isrc:
+                        isrcs[track["id"]] = isrc
+    except Exception:  # noqa: BLE001
+        return isrcs
+    return isrcs
+
+
 def _fetch_via_oembed(ref: SpotifyRef) -> NormalizedItem:
     try:
         resp = requests.get(
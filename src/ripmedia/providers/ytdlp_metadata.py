@@ -1,15 +1,42 @@
 from __future__ import annotations
 
-from typing import Any
-
-from yt_dlp import YoutubeDL
-
+import queue
+import threading
+import weakref
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 from ..errors import MetadataError
 from ..model import MediaKind, NormalizedItem, Provider
 from ..shared import NoopLogger, apply_cookie_options
 
+# yt-dlp info fields carried along in NormalizedItem.extra["ytdlp"].
+_KEEP_INFO_KEYS = frozenset(
+    {
+        "id",
+        "title",
+        "duration",
+        "webpage_url",
+        "extractor",
+        "extractor_key",
+        "uploader",
+        "channel",
+        "artist",
+        "album",
+        "track_number",
+        "release_year",
+        "upload_date",
+        "thumbnail",
+        "playlist_count",
+    }
+)
+
+# Entries buffered ahead of the consumer; the producer waits once this many are queued.
+_STREAM_QUEUE_SIZE = 64
+# How often a producer blocked on a full queue checks whether the consumer went away.
+_STREAM_STOP_POLL_SECONDS = 0.2
+
 
 def fetch_ytdlp_metadata(
     url: str,
@@ -19,19 +46,9 @@ def fetch_ytdlp_metadata(
     cookies_from_browser: str | None = None,
 ) -> NormalizedItem:
     try:
-        ydl_opts = {
-            "quiet": True,
-            "skip_download": True,
-            "noplaylist": False,
-            "no_warnings": True,
-            "logger": NoopLogger(),
-        }
-        apply_cookie_options(
-            ydl_opts,
-            cookies=cookies,
-            cookies_from_browser=cookies_from_browser,
-        )
+        from yt_dlp import YoutubeDL
 
+        ydl_opts = _metadata_options(cookies=cookies, cookies_from_browser=cookies_from_browser)
         with YoutubeDL(ydl_opts) as ydl:
             info = ydl.extract_info(url, download=False)
     except Exception as e:  # noqa: BLE001
@@ -41,37 +58,147 @@ def fetch_ytdlp_metadata(
         raise MetadataError("Unexpected yt-dlp metadata response.", stage="Metadata")
 
     kind = _guess_kind(info)
-    title = info.get("title")
-    duration = info.get("duration")
-    thumbnail = _pick_thumbnail(info)
+    entries = _extract_entries(provider, info) if kind == MediaKind.PLAYLIST else None
+    return _build_item(url, provider=provider, kind=kind, info=info, entries=entries)
 
-    artist = info.get("artist") or info.get("uploader") or info.get("channel")
-    album = info.get("album")
-    track_number = info.get("track_number")
-    release_year = info.get("release_year")
-    upload_date = info.get("upload_date")
 
-    entries = _extract_entries(provider, info) if kind == MediaKind.PLAYLIST else None
+def stream_ytdlp_metadata(
+    url: str,
+    *,
+    provider: Provider,
+    cookies: Path | None = None,
+    cookies_from_browser: str | None = None,
+) -> tuple[NormalizedItem, Iterator[NormalizedItem] | None]:
+    """Fetch metadata, yielding playlist entries while yt-dlp is still extracting them.
+
+    Playlists are probed with ``process=False`` on a background thread; the returned
+    iterator hands entries over through a bounded queue as soon as each one is known.
+    The producer stops once the iterator is closed, exhausted or garbage collected.
+    Single items are fully processed and returned with ``None`` for the iterator.
+    """
+    messages: queue.Queue[tuple[str, Any]] = queue.Queue(maxsize=_STREAM_QUEUE_SIZE)
+    stop = threading.Event()
+    ydl_opts = _metadata_options(cookies=cookies, cookies_from_browser=cookies_from_browser)
+
+    def _put(message: tuple[str, Any]) -> bool:
+        while not stop.is_set():
+            try:
+                messages.put(message, timeout=_STREAM_STOP_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        try:
+            from yt_dlp import YoutubeDL
+
+            with YoutubeDL(ydl_opts) as ydl:
+                info = ydl.extract_info(url, download=False, process=False)
+                if isinstance(info, dict) and not _is_playlist(info):
+                    info = ydl.process_ie_result(info, download=False)
+                if not isinstance(info, dict) or not _is_playlist(info):
+                    _put(("info", info))
+                    return
+                raw_entries = info.get("entries") or []
+                if not _put(("info", {k: v for k, v in info.items() if k != "entries"})):
+                    return
+                # Lazy entry lists pull further pages from yt-dlp on each step.
+                for idx, e in enumerate(raw_entries, start=1):
+                    if stop.is_set():
+                        return
+                    entry = _entry_item(provider, e, idx)
+                    if entry is not None and not _put(("entry", entry)):
+                        return
+        except Exception as e:  # noqa: BLE001
+            _put(("error", e))
+        finally:
+            _put(("done", None))
+
+    threading.Thread(target=_produce, name="ripmedia-metadata", daemon=True).start()
+
+    msg, info = messages.get()
+    if msg == "error":
+        raise MetadataError(
+            f"Failed to fetch metadata via yt-dlp: {info}", stage="Metadata"
+        ) from info
+    if not isinstance(info, dict):
+        raise MetadataError("Unexpected yt-dlp metadata response.", stage="Metadata")
+
+    kind = _guess_kind(info)
+    if kind != MediaKind.PLAYLIST:
+        return _build_item(url, provider=provider, kind=kind, info=info, entries=None), None
+
+    def _consume() -> Iterator[NormalizedItem]:
+        try:
+            while True:
+                msg, value = messages.get()
+                if msg == "done":
+                    return
+                if msg == "error":
+                    raise MetadataError(
+                        f"Failed to fetch playlist entries via yt-dlp: {value}", stage="Metadata"
+                    ) from value
+                yield value
+        finally:
+            stop.set()
+
+    entries = _consume()
+    # The finally above never runs for an iterator that was dropped before its first
+    # step, so collection also stops the producer.
+    weakref.finalize(entries, stop.set)
+    return _build_item(url, provider=provider, kind=kind, info=info, entries=None), entries
+
+
+def _metadata_options(*, cookies: Path | None, cookies_from_browser: str | None) -> dict[str, Any]:
+    ydl_opts: dict[str, Any] = {
+        "quiet": True,
+        "skip_download": True,
+        "noplaylist": False,
+        "no_warnings": True,
+        "logger": NoopLogger(),
+    }
+    apply_cookie_options(
+        ydl_opts,
+        cookies=cookies,
+        cookies_from_browser=cookies_from_browser,
+    )
+    return ydl_opts
+
+
+def _build_item(
+    url: str,
+    *,
+    provider: Provider,
+    kind: MediaKind,
+    info: dict[str, Any],
+    entries: list[NormalizedItem] | None,
+) -> NormalizedItem:
     return NormalizedItem(
         provider=provider,
         kind=kind,
         id=info.get("id"),
         url=url,
-        title=title,
-        artist=artist,
-        album=album,
-        track_number=track_number,
-        year=release_year,
-        date=upload_date,
-        duration_seconds=duration,
-        artwork_url=thumbnail,
+        title=info.get("title"),
+        artist=info.get("artist") or info.get("uploader") or info.get("channel"),
+        album=info.get("album"),
+        track_number=info.get("track_number"),
+        year=info.get("release_year"),
+        date=info.get("upload_date"),
+        duration_seconds=info.get("duration"),
+        artwork_url=_pick_thumbnail(info),
         entries=entries,
         extra={"ytdlp": _minimize_info(info)},
     )
 
 
+def _is_playlist(info: dict[str, Any]) -> bool:
+    # Must match _guess_kind: entries are only streamed when the consumer expects them.
+    return info.get("_type") == "playlist"
+
+
 def _guess_kind(info: dict[str, Any]) -> MediaKind:
-    if info.get("_type") == "playlist":
+    if _is_playlist(info):
         return MediaKind.PLAYLIST
     if info.get("ie_key") == "YoutubeTab":
         return MediaKind.PLAYLIST
@@ -82,23 +209,7 @@ def _guess_kind(info: dict[str, Any]) -> MediaKind:
 
 
 def _minimize_info(info: dict[str, Any]) -> dict[str, Any]:
-    keep = {
-        "id",
-        "title",
-        "duration",
-        "webpage_url",
-        "extractor",
-        "extractor_key",
-        "uploader",
-        "channel",
-        "artist",
-        "album",
-        "track_number",
-        "release_year",
-        "upload_date",
-        "thumbnail",
-    }
-    return {k: info.get(k) for k in keep if k in info}
+    return {k: info[k] for k in _KEEP_INFO_KEYS & info.keys()}
 
 
 def _pick_thumbnail(info: dict[str, Any]) -> str | None:
@@ -120,20 +231,25 @@ def _extract_entries(provider: Provider, info: dict[str, Any]) -> list[Normalize
         return None
     entries: list[NormalizedItem] = []
     for idx, e in enumerate(raw_entries, start=1):
-        if not isinstance(e, dict):
-            continue
-        entry_url = e.get("webpage_url") or e.get("url")
-        if not entry_url:
-            continue
-        entries.append(
-            NormalizedItem(
-                provider=provider,
-                kind=MediaKind.VIDEO,
-                id=e.get("id"),
-                url=str(entry_url),
-                title=e.get("title"),
-                track_number=e.get("playlist_index") or idx,
-                artwork_url=e.get("thumbnail"),
-            )
-        )
+        entry = _entry_item(provider, e, idx)
+        if entry is not None:
+            entries.append(entry)
     return entries or None
+
+
+def _entry_item(provider: Provider, e: Any, idx: int) -> NormalizedItem | None:
+    if not isinstance(e, dict):
+        return None
+    entry_url = e.get("webpage_url") or e.get("url")
+    if not entry_url:
+        return None
+    return NormalizedItem(
+        provider=provider,
+        kind=MediaKind.VIDEO,
+        id=e.get("id"),
+        url=str(entry_url),
+        title=e.get("title"),
+        track_number=e.get("playlist_index") or idx,
+        # Flat (process=False) entries often carry only a ``thumbnails`` list.
+        artwork_url=_pick_thumbnail(e),
+    )
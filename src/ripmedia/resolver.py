@@ -1,17 +1,28 @@
 from __future__ import annotations
 
 import difflib
+import heapq
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 
-from yt_dlp import YoutubeDL
+try:
+    from rapidfuzz import fuzz as _fuzz
+    from rapidfuzz import process as _process
+except ImportError:  # optional: falls back to difflib
+    _fuzz = None
+    _process = None
 
 from .errors import ResolveError
 from .model import NormalizedItem, Provider
 from .shared import NoopLogger
 
+# Confidence at which an ISRC search hit is accepted without the plain-search fallback.
+_CONFIDENT_MATCH = 0.95
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ResolvedSource:
     url: str
     provider: Provider
@@ -76,53 +87,88 @@ def _resolve_candidates_from_search(
         search_queries.append(f"{prefix}{max(limit,5)}:{base_query} {isrc}")
     search_queries.append(f"{prefix}{max(limit,5)}:{base_query}")
 
-    entries: list[dict] = []
+    isrc_low = isrc.lower() if isrc else None
+    label = "YouTube" if provider == Provider.YOUTUBE else "SoundCloud"
+    # Each worker gets its own YoutubeDL since one instance is not safe to share
+    # across threads.
+    executor = ThreadPoolExecutor(max_workers=len(search_queries))
     try:
-        with YoutubeDL(
-            {
-                "quiet": True,
-                "skip_download": True,
-                "extract_flat": "in_playlist",
-                "no_warnings": True,
-                "logger": NoopLogger(),
-            }
-        ) as ydl:
-            for search in search_queries:
-                info = ydl.extract_info(search, download=False)
-                if isinstance(info, dict):
-                    entries.extend([e for e in (info.get("entries") or []) if isinstance(e, dict)])
-    except Exception as e:  # noqa: BLE001
-        label = "YouTube" if provider == Provider.YOUTUBE else "SoundCloud"
-        raise ResolveError(f"{label} search failed: {e}", stage="Resolve") from e
-
-    if not entries:
-        return []
+        futures = [executor.submit(_run_search, q) for q in search_queries]
+        entries: list[dict] = []
+        for idx, future in enumerate(futures):
+            try:
+                entries.extend(future.result())
+            except Exception as e:  # noqa: BLE001
+                raise ResolveError(f"{label} search failed: {e}", stage="Resolve") from e
+            candidates = _rank_entries(
+                item, entries, provider=provider, isrc_low=isrc_low, limit=limit
+            )
+            # An ISRC hit this strong will not be beaten by the plain search; don't
+            # wait for it.
+            if idx == 0 and isrc and candidates and candidates[0].confidence >= _CONFIDENT_MATCH:
+                return candidates
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return candidates
 
+
+def _rank_entries(
+    item: NormalizedItem,
+    entries: list[dict],
+    *,
+    provider: Provider,
+    isrc_low: str | None,
+    limit: int,
+) -> list[ResolvedSource]:
     deduped: dict[str, dict] = {}
     for e in entries:
         url = _entry_url(provider, e)
         if not url:
             continue
         deduped[url] = e
+    if not deduped:
+        return []
+
+    urls = list(deduped)
+    cands = list(deduped.values())
+    exp_title = _norm_text(item.title or "")
+    exp_artist = _norm_text(item.artist or "")
+    scores = _score_candidates(exp_title, exp_artist, item.duration_seconds, cands, isrc_low)
 
+    # Stable on ties, like sorting all candidates by confidence would be.
+    top = heapq.nlargest(limit, range(len(cands)), key=scores.__getitem__)
     candidates: list[ResolvedSource] = []
-    for url, e in deduped.items():
-        candidate_duration = e.get("duration")
-        hint = _duration_hint(item.duration_seconds, candidate_duration)
-        confidence = _score_candidate(item, e)
+    for i in top:
+        e = cands[i]
         candidates.append(
             ResolvedSource(
-                url=url,
+                url=urls[i],
                 provider=provider,
-                confidence=confidence,
-                confidence_hint=hint,
+                confidence=scores[i],
+                confidence_hint=_duration_hint(item.duration_seconds, e.get("duration")),
                 selected_title=e.get("title"),
                 selected_channel=e.get("channel") or e.get("uploader"),
             )
         )
-
-    candidates.sort(key=lambda c: c.confidence, reverse=True)
-    return candidates[:limit]
+    return candidates
+
+
+def _run_search(search: str) -> list[dict]:
+    from yt_dlp import YoutubeDL
+
+    with YoutubeDL(
+        {
+            "quiet": True,
+            "skip_download": True,
+            "extract_flat": "in_playlist",
+            "no_warnings": True,
+            "logger": NoopLogger(),
+        }
+    ) as ydl:
+        info = ydl.extract_info(search, download=False)
+    if not isinstance(info, dict):
+        return []
+    return [e for e in (info.get("entries") or []) if isinstance(e, dict)]
 
 
 def _entry_url(provider: Provider, entry: dict) -> str | None:
@@ -135,47 +181,78 @@ def _entry_url(provider: Provider, entry: dict) -> str | None:
     return url_s
 
 
-def _score_candidate(item: NormalizedItem, candidate: dict) -> float:
-    expected_title = _norm_text(item.title or "")
-    expected_artist = _norm_text(item.artist or "")
-
-    cand_title = _norm_text(candidate.get("title") or "")
-    cand_channel = _norm_text(candidate.get("channel") or "")
-    cand_uploader = _norm_text(candidate.get("uploader") or "")
-
-    title_score = _similarity(expected_title, cand_title)
-    if expected_artist:
-        artist_score = max(
-            _similarity(expected_artist, cand_channel),
-            _contains(expected_artist, cand_channel),
-            _similarity(expected_artist, cand_uploader),
-            _contains(expected_artist, cand_uploader),
-            _similarity(expected_artist, cand_title),  # catches "Artist - Title" cases
-            _contains(expected_artist, cand_title),
-        )
-    else:
-        artist_score = 0.0
-
-    base: float
-    if item.duration_seconds is None or candidate.get("duration") is None:
-        base = (0.7 * title_score) + (0.3 * artist_score)
+def _score_candidate(
+    exp_title: str,
+    exp_artist: str,
+    expected_dur: int | None,
+    candidate: dict,
+    isrc_low: str | None,
+) -> float:
+    return _score_candidates(exp_title, exp_artist, expected_dur, [candidate], isrc_low)[0]
+
+
+def _score_candidates(
+    exp_title: str,
+    exp_artist: str,
+    expected_dur: int | None,
+    candidates: list[dict],
+    isrc_low: str | None,
+) -> list[float]:
+    """Score all candidates at once.
+
+    Candidate fields are normalized into parallel lists so each similarity column is
+    computed in a single batch call instead of per candidate. ``isrc_low`` is the
+    lowercased ISRC, or ``None`` to skip the ISRC bonus entirely.
+    """
+    n = len(candidates)
+    titles: list[str] = []
+    channels: list[str] = []
+    uploaders: list[str] = []
+    durations: list[int | None] = []
+    for candidate in candidates:
+        get = candidate.get
+        titles.append(_norm_text(get("title") or ""))
+        channels.append(_norm_text(get("channel") or ""))
+        uploaders.append(_norm_text(get("uploader") or ""))
+        durations.append(get("duration"))
+
+    title_scores = _similarities(exp_title, titles)
+    if exp_artist:
+        artist_scores = [
+            max(sims)
+            for sims in zip(
+                _similarities(exp_artist, channels),
+                _similarities(exp_artist, uploaders),
+                _similarities(exp_artist, titles),  # catches "Artist - Title" cases
+                strict=True,
+            )
+        ]
+        for i in range(n):
+            if artist_scores[i] < 1.0 and (
+                _contains(exp_artist, channels[i])
+                or _contains(exp_artist, uploaders[i])
+                or _contains(exp_artist, titles[i])
+            ):
+                artist_scores[i] = 1.0
     else:
-        delta = abs(int(item.duration_seconds) - int(candidate["duration"]))
-        duration_score = max(0.0, 1.0 - (delta / 30.0))  # 0 at >=30s mismatch
-        base = (0.45 * title_score) + (0.35 * artist_score) + (0.20 * duration_score)
-
-    isrc = _spotify_isrc(item)
-    if isrc:
-        hay = " ".join(
-            [
-                str(candidate.get("title") or ""),
-                str(candidate.get("channel") or ""),
-                str(candidate.get("uploader") or ""),
-            ]
-        ).lower()
-        if isrc.lower() in hay:
+        artist_scores = [0.0] * n
+
+    scores: list[float] = []
+    for i, duration in enumerate(durations):
+        if expected_dur is None or duration is None:
+            base = (0.7 * title_scores[i]) + (0.3 * artist_scores[i])
+        else:
+            delta = abs(int(expected_dur) - int(duration))
+            duration_score = max(0.0, 1.0 - (delta / 30.0))  # 0 at >=30s mismatch
+            base = (0.45 * title_scores[i]) + (0.35 * artist_scores[i]) + (0.20 * duration_score)
+
+        # Normalized text is already lowercased and keeps alphanumerics intact.
+        if isrc_low and (
+            isrc_low in titles[i] or isrc_low in channels[i] or isrc_low in uploaders[i]
+        ):
             base += 0.15
-    return min(1.0, base)
+        scores.append(min(1.0, base))
+    return scores
 
 
 def _duration_hint(expected: int | None, actual: int | None) -> str | None:
@@ -189,18 +266,29 @@ def _duration_hint(expected: int | None, actual: int | None) -> str | None:
 _PUNCT = re.compile(r"[^a-z0-9]+")
 
 
+@lru_cache(maxsize=2048)
 def _norm_text(value: str) -> str:
-    value = value.lower()
-    value = value.replace("&", " and ")
-    value = _PUNCT.sub(" ", value)
-    value = re.sub(r"\s+", " ", value).strip()
-    return value
-
-
-def _similarity(a: str, b: str) -> float:
-    if not a or not b:
-        return 0.0
-    return difflib.SequenceMatcher(None, a, b).ratio()
+    # _PUNCT already collapses whitespace runs, so one pass is enough.
+    return _PUNCT.sub(" ", value.lower().replace("&", " and ")).strip()
+
+
+def _similarities(query: str, choices: list[str]) -> list[float]:
+    if not query:
+        return [0.0] * len(choices)
+    scores = [0.0] * len(choices)
+    if _process is not None:
+        for choice, score, idx in _process.extract(
+            query, choices, scorer=_fuzz.ratio, limit=None
+        ):
+            if choice:
+                scores[idx] = score / 100.0
+        return scores
+    matcher = difflib.SequenceMatcher(None, query)
+    for idx, choice in enumerate(choices):
+        if choice:
+            matcher.set_seq2(choice)
+            scores[idx] = matcher.ratio()
+    return scores
 
 
 def _contains(needle: str, haystack: str) -> float:
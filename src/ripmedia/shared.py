@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import os
+import shutil
 import subprocess
 import sys
+from collections.abc import Mapping
+from functools import cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from .ytdlp_utils import normalize_cookies_from_browser
@@ -36,8 +40,9 @@ def apply_cookie_options(
 
 def format_duration(seconds: float) -> str:
     total = int(round(seconds))
-    if total < 0:
-        total = 0
+    if total < 60:
+        # Most step timings are under a minute.
+        return f"00:{max(total, 0):02d}"
     mins, secs = divmod(total, 60)
     hours, mins = divmod(mins, 60)
     if hours:
@@ -45,30 +50,49 @@ def format_duration(seconds: float) -> str:
     return f"{mins:02d}:{secs:02d}"
 
 
+# Speed unit -> (factor from bytes/s, suffix). Unknown units display as MB/s.
+_SPEED_UNITS: Mapping[str, tuple[float, str]] = MappingProxyType(
+    {
+        "Mbps": (8 / 1_000_000, "Mb/s"),
+        "MBps": (1 / 1_000_000, "MB/s"),
+    }
+)
+_DEFAULT_SPEED_UNIT = _SPEED_UNITS["MBps"]
+
+
 def format_speed(speed_bps: float, unit: str) -> str:
-    if unit == "Mbps":
-        value = (float(speed_bps) * 8) / 1_000_000
-        suffix = "Mb/s"
-    else:
-        value = float(speed_bps) / 1_000_000
-        suffix = "MB/s"
-    return f"{value:>5.1f} {suffix}"
+    factor, suffix = _SPEED_UNITS.get(unit, _DEFAULT_SPEED_UNIT)
+    return f"{speed_bps * factor:>5.1f} {suffix}"
+
+
+_PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+_JPEG_MAGIC = b"\xff\xd8\xff"
+_GIF_MAGICS = frozenset((b"GIF87a", b"GIF89a"))
 
 
 def sniff_image_mime(blob: bytes) -> str | None:
-    if blob.startswith(b"\x89PNG\r\n\x1a\n"):
-        return "image/png"
-    if blob.startswith(b"\xff\xd8\xff"):
-        return "image/jpeg"
-    if blob[:4] == b"RIFF" and blob[8:12] == b"WEBP":
-        return "image/webp"
-    if blob.startswith(b"GIF87a") or blob.startswith(b"GIF89a"):
-        return "image/gif"
+    # Only the first 12 bytes are ever examined, so callers can pass whole files.
+    # Every supported signature starts with a distinct byte; dispatch on it so
+    # non-image data is rejected after a single index.
+    if not blob:
+        return None
+    first = blob[0]
+    if first == 0xFF:
+        return "image/jpeg" if blob.startswith(_JPEG_MAGIC) else None
+    if first == 0x89:
+        return "image/png" if blob.startswith(_PNG_MAGIC) else None
+    if first == 0x52:  # "R"
+        # startswith with an offset compares in place, without slicing out copies.
+        if len(blob) >= 12 and blob.startswith(b"RIFF") and blob.startswith(b"WEBP", 8):
+            return "image/webp"
+        return None
+    if first == 0x47:  # "G"
+        return "image/gif" if blob[:6] in _GIF_MAGICS else None
     return None
 
 
-def image_mime_from_ext(ext: str) -> str | None:
-    return {
+_EXT_TO_MIME: Mapping[str, str] = MappingProxyType(
+    {
         ".jpg": "image/jpeg",
         ".jpeg": "image/jpeg",
         ".png": "image/png",
@@ -77,17 +101,35 @@ def image_mime_from_ext(ext: str) -> str | None:
         ".bmp": "image/bmp",
         ".avif": "image/avif",
         ".heic": "image/heic",
-    }.get(ext.lower())
+    }
+)
 
-
-def image_ext_from_mime(mime: str) -> str:
-    return {
+_MIME_TO_EXT: Mapping[str, str] = MappingProxyType(
+    {
         "image/jpeg": ".jpg",
         "image/png": ".png",
         "image/webp": ".webp",
         "image/avif": ".avif",
         "image/heic": ".heic",
-    }.get(mime, ".img")
+    }
+)
+
+
+def image_mime_from_ext(ext: str) -> str | None:
+    return _EXT_TO_MIME.get(ext.lower())
+
+
+def image_ext_from_mime(mime: str) -> str:
+    return _MIME_TO_EXT.get(mime, ".img")
+
+
+@cache
+def find_ffmpeg_tool(name: str) -> str | None:
+    """Return the full path of ``ffmpeg`` or ``ffprobe``, or None if it is not installed.
+
+    Resolved once per process; tagging and mp4 post-processing share the answer.
+    """
+    return shutil.which(name)
 
 
 def open_with_default_app(path: Path, *, reveal_parent: bool = False) -> None:
@@ -97,7 +139,13 @@ def open_with_default_app(path: Path, *, reveal_parent: bool = False) -> None:
 
     if sys.platform.startswith("win"):
         os.startfile(str(target))
-    elif sys.platform == "darwin":
-        subprocess.run(["open", str(target)], check=False)
-    else:
-        subprocess.run(["xdg-open", str(target)], check=False)
+        return
+    opener = "open" if sys.platform == "darwin" else "xdg-open"
+    # Don't wait for the handler app; it may take a while to start or never exit.
+    subprocess.Popen(
+        [opener, str(target)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
@@ -1,15 +1,60 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from pathlib import Path
+import hashlib
+import io
+import os
 import subprocess
 import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import urllib3
+
+try:
+    from mutagen.id3 import (
+        APIC,
+        COMM,
+        ID3,
+        TALB,
+        TDRC,
+        TIT2,
+        TPE1,
+        TPE2,
+        TPOS,
+        TRCK,
+        ID3NoHeaderError,
+    )
+
+    _HAS_MUTAGEN_MP3 = True
+except ImportError:
+    _HAS_MUTAGEN_MP3 = False
+
+from .errors import RipmediaError, TagError
+from .model import Attribution, NormalizedItem
+from .shared import find_ffmpeg_tool, image_ext_from_mime, sniff_image_mime
 
-import requests
+# Artwork is a plain GET; a shared pool keeps connections to the cover CDNs alive.
+_POOL = urllib3.PoolManager(
+    num_pools=8,
+    maxsize=32,
+    headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"},
+)
 
-from .errors import TagError
-from .model import Attribution, NormalizedItem
-from .shared import image_ext_from_mime, sniff_image_mime
+# Cover art is normally well under this; larger responses are not embedded.
+_MAX_ARTWORK_BYTES = 4 * 1024 * 1024
+
+# Artwork URL -> downloaded artwork, least recently used first. Failures are not
+# cached, so a later item can retry the URL.
+_ARTWORK_CACHE: OrderedDict[str, Artwork] = OrderedDict()
+_ARTWORK_CACHE_MAX = 64
+_ARTWORK_CACHE_LOCK = threading.Lock()
 
 
 @dataclass(frozen=True)
@@ -23,18 +68,49 @@ def tag_file(
     *,
     artwork_override: Artwork | None = None,
 ) -> TagResult:
-    suffix = path.suffix.lower()
+    handler = _DISPATCH.get(path.suffix.lower())
+    if handler is None:
+        # ffmpeg retagging never embeds artwork, so don't fetch any.
+        return _tag_with_ffmpeg(path, item)
     if artwork_override is not None:
         artwork = artwork_override
     else:
         artwork = _download_artwork(item.artwork_url, referer=item.url) if item.artwork_url else None
+    return handler(path, item, artwork)
 
-    if suffix == ".mp3":
-        return _tag_mp3(path, item, artwork)
-    if suffix in {".m4a", ".mp4"}:
-        return _tag_mp4(path, item, artwork)
 
-    return _tag_with_ffmpeg(path, item)
+def tag_files(
+    jobs: Iterable[tuple[Path, NormalizedItem, Artwork | None]],
+    *,
+    max_workers: int = 8,
+) -> list[TagResult | RipmediaError]:
+    """Tag ``(path, item, artwork_override)`` jobs concurrently.
+
+    Results are returned in job order; a failed job yields its error instead.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return []
+    # Fetch each distinct cover once up front so the workers only hit the cache.
+    covers = {
+        item.artwork_url: item.url
+        for path, item, override in jobs
+        if override is None and item.artwork_url and path.suffix.lower() in _DISPATCH
+    }
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        wait([executor.submit(_download_artwork, url, referer=ref) for url, ref in covers.items()])
+        return list(executor.map(_tag_job, jobs))
+
+
+def _tag_job(job: tuple[Path, NormalizedItem, Artwork | None]) -> TagResult | RipmediaError:
+    path, item, artwork = job
+    try:
+        return tag_file(path, item, artwork_override=artwork)
+    except RipmediaError as e:
+        return e
+    except Exception as e:  # noqa: BLE001
+        # Keep one file's failure (ffmpeg missing, unreadable tags, ...) out of the batch.
+        return TagError(str(e), stage="Tagging")
 
 
 @dataclass(frozen=True)
@@ -44,19 +120,150 @@ class Artwork:
 
 
 def _download_artwork(url: str, *, referer: str | None = None) -> Artwork | None:
+    # Album tracks share one cover URL, so each artwork is fetched once per process
+    # and kept on disk across runs. The referer (the track page) only gates access,
+    # so it is not part of the key.
+    with _ARTWORK_CACHE_LOCK:
+        cached = _ARTWORK_CACHE.get(url)
+        if cached is not None:
+            _ARTWORK_CACHE.move_to_end(url)
+            return cached
+    artwork = _read_cached_artwork(url) or _fetch_artwork(url, referer=referer)
+    if artwork is None:
+        return None
+    with _ARTWORK_CACHE_LOCK:
+        _ARTWORK_CACHE[url] = artwork
+        _ARTWORK_CACHE.move_to_end(url)
+        while len(_ARTWORK_CACHE) > _ARTWORK_CACHE_MAX:
+            _ARTWORK_CACHE.popitem(last=False)
+    return artwork
+
+
+def _fetch_artwork(url: str, *, referer: str | None) -> Artwork | None:
     try:
-        headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
+        headers = dict(_POOL.headers)
         if referer:
             headers["Referer"] = referer
-        resp = requests.get(url, timeout=20, headers=headers)
-        resp.raise_for_status()
-        mime = (resp.headers.get("content-type") or "").split(";")[0].strip().lower()
-        blob = resp.content
+        resp = _POOL.request("GET", url, headers=headers, timeout=20, preload_content=False)
+        blob = b""
+        try:
+            if resp.status >= 400:
+                return None
+            length = resp.headers.get("content-length")
+            if length and length.isdigit() and int(length) > _MAX_ARTWORK_BYTES:
+                return None
+            mime = (resp.headers.get("content-type") or "").split(";")[0].strip().lower()
+            blob = resp.read(_MAX_ARTWORK_BYTES + 1, decode_content=True)
+        finally:
+            # Only a fully read body leaves the connection reusable.
+            if not blob or len(blob) > _MAX_ARTWORK_BYTES:
+                resp.close()
+            resp.release_conn()
+        if not blob or len(blob) > _MAX_ARTWORK_BYTES:
+            return None
         if not mime:
             mime = sniff_image_mime(blob) or "image/jpeg"
-        return Artwork(bytes=blob, mime=mime)
     except Exception:  # noqa: BLE001
         return None
+    _write_cached_artwork(url, blob, mime)
+    return Artwork(bytes=blob, mime=mime)
+
+
+# Disk cache limits. Older entries are fetched again, so covers changed upstream are
+# picked up; past the size cap the least recently written files go first. Deleting
+# ~/.ripmedia/cache/artwork is always safe.
+_ARTWORK_DISK_MAX_AGE_SECONDS = 30 * 24 * 3600
+_ARTWORK_DISK_MAX_BYTES = 256 * 1024 * 1024
+# Temp files this old are left over from interrupted writes, not writes in progress.
+_ARTWORK_STALE_TMP_SECONDS = 3600
+
+
+def _artwork_cache_dir() -> Path:
+    return Path.home() / ".ripmedia" / "cache" / "artwork"
+
+
+def _artwork_cache_path(url: str) -> Path:
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return _artwork_cache_dir() / digest
+
+
+# Cache files start with a "<mime>\n" line so formats the sniffer doesn't know
+# (AVIF, HEIC, BMP, ...) keep their type. No image signature starts with "image/",
+# so older header-less files are still read, by sniffing.
+_CACHE_MIME_PREFIX = b"image/"
+
+
+def _read_cached_artwork(url: str) -> Artwork | None:
+    try:
+        with _artwork_cache_path(url).open("rb") as f:
+            if time.time() - os.fstat(f.fileno()).st_mtime > _ARTWORK_DISK_MAX_AGE_SECONDS:
+                return None
+            blob = f.read()
+    except OSError:
+        return None
+    mime: str | None = None
+    if blob.startswith(_CACHE_MIME_PREFIX):
+        header, sep, blob = blob.partition(b"\n")
+        if not sep:
+            return None
+        mime = header.decode("ascii", "replace")
+    if not blob:
+        return None
+    return Artwork(bytes=blob, mime=mime or sniff_image_mime(blob) or "image/jpeg")
+
+
+def _write_cached_artwork(url: str, blob: bytes, mime: str) -> None:
+    if not blob:
+        return
+    # Only image types can be told apart from header-less files on read.
+    header = mime.encode("ascii", "replace") + b"\n" if mime.startswith("image/") else b""
+    path = _artwork_cache_path(url)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _prune_artwork_cache(path.parent)
+        # Written aside and renamed, so readers never see a partial file.
+        tmp_path.write_bytes(header + blob)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+@cache
+def _prune_artwork_cache(directory: Path) -> None:
+    """Apply the disk cache limits; runs once per process, before the first write."""
+    now = time.time()
+    kept: list[tuple[float, int, str]] = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                if entry.name.endswith(".tmp"):
+                    expired = now - st.st_mtime > _ARTWORK_STALE_TMP_SECONDS
+                else:
+                    expired = now - st.st_mtime > _ARTWORK_DISK_MAX_AGE_SECONDS
+                if expired:
+                    _unlink_quietly(entry.path)
+                else:
+                    kept.append((st.st_mtime, st.st_size, entry.path))
+    except OSError:
+        return
+    kept.sort(reverse=True)
+    total = 0
+    for _, size, path in kept:
+        total += size
+        if total > _ARTWORK_DISK_MAX_BYTES:
+            _unlink_quietly(path)
+
+
+def _unlink_quietly(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
 
 
 def _mime_extension(mime: str) -> str:
@@ -64,11 +271,34 @@ def _mime_extension(mime: str) -> str:
 
 
 def _coerce_artwork(artwork: Artwork) -> Artwork:
-    mime = artwork.mime or sniff_image_mime(artwork.bytes) or "image/jpeg"
-    return Artwork(bytes=artwork.bytes, mime=mime)
+    if artwork.mime:
+        return artwork
+    return Artwork(bytes=artwork.bytes, mime=sniff_image_mime(artwork.bytes) or "image/jpeg")
 
 
 def _convert_artwork_to_jpeg(artwork: Artwork) -> Artwork | None:
+    return _convert_with_pillow(artwork) or _convert_with_ffmpeg(artwork)
+
+
+def _convert_with_pillow(artwork: Artwork) -> Artwork | None:
+    try:
+        from PIL import Image
+    except ImportError:  # optional: falls back to ffmpeg
+        return None
+    try:
+        with Image.open(io.BytesIO(artwork.bytes)) as img:
+            rgb = img if img.mode in ("RGB", "L") else img.convert("RGB")
+            buf = io.BytesIO()
+            rgb.save(buf, format="JPEG", quality=90)
+    except Exception:  # noqa: BLE001 - e.g. no AVIF/HEIC decoder; let ffmpeg try
+        return None
+    return Artwork(bytes=buf.getvalue(), mime="image/jpeg")
+
+
+def _convert_with_ffmpeg(artwork: Artwork) -> Artwork | None:
+    ffmpeg = find_ffmpeg_tool("ffmpeg")
+    if ffmpeg is None:
+        return None
     input_ext = _mime_extension(artwork.mime)
     with tempfile.NamedTemporaryFile(delete=False, suffix=input_ext) as tmp_in:
         tmp_in.write(artwork.bytes)
@@ -78,7 +308,7 @@ def _convert_artwork_to_jpeg(artwork: Artwork) -> Artwork | None:
     try:
         proc = subprocess.run(
             [
-                "ffmpeg",
+                ffmpeg,
                 "-y",
                 "-loglevel",
                 "error",
@@ -111,17 +341,21 @@ def _convert_artwork_to_jpeg(artwork: Artwork) -> Artwork | None:
                     pass
 
 
+# Cover formats both ID3 APIC and MP4 covr take as-is.
+_DIRECT_OK_MIMES = frozenset({"image/jpeg", "image/png"})
+
+
 def _prepare_artwork(artwork: Artwork | None, *, target: str) -> Artwork | None:
     if artwork is None:
         return None
+    if artwork.mime in _DIRECT_OK_MIMES:
+        return artwork
     artwork = _coerce_artwork(artwork)
-    if target == "mp4":
-        if artwork.mime in {"image/jpeg", "image/png"}:
-            return artwork
-        return _convert_artwork_to_jpeg(artwork)
-    if artwork.mime in {"image/jpeg", "image/png"}:
+    if artwork.mime in _DIRECT_OK_MIMES:
         return artwork
     converted = _convert_artwork_to_jpeg(artwork)
+    if target == "mp4":
+        return converted
     return converted or artwork
 
 
@@ -129,9 +363,9 @@ def _attribution_note(attribution: Attribution | None) -> str | None:
     if attribution is None:
         return None
     meta = attribution.metadata_source.value
-    media = attribution.media_source.value if attribution.media_source is not None else None
-    if media and media != meta:
-        return f"Metadata: {meta}, Media source: {media}"
+    media_source = attribution.media_source
+    if media_source is not None and media_source.value != meta:
+        return f"Metadata: {meta}, Media source: {media_source.value}"
     return f"Metadata: {meta}"
 
 
@@ -147,50 +381,90 @@ def _album_artist(item: NormalizedItem) -> str | None:
     return item.artist
 
 
+# Free space reserved in the tag region on save, so a later retag that grows the tags
+# is written in place instead of shifting the whole file.
+_ID3_PADDING = 4096
+_MP4_PADDING = 2048
+
+
+def _id3_padding(info) -> int:
+    return max(_ID3_PADDING, info.padding)
+
+
+def _mp4_padding(info) -> int:
+    return max(_MP4_PADDING, info.padding)
+
+
 def _tag_mp3(path: Path, item: NormalizedItem, artwork: Artwork | None) -> TagResult:
+    if not _HAS_MUTAGEN_MP3:
+        raise TagError("Failed to tag mp3: mutagen is not installed.", stage="Tagging")
     try:
-        from mutagen.id3 import (
-            APIC,
-            COMM,
-            ID3,
-            ID3NoHeaderError,
-            TALB,
-            TDRC,
-            TIT2,
-            TPE1,
-            TPE2,
-            TPOS,
-            TRCK,
-        )
-        try:
-            tags = ID3(path)
-        except ID3NoHeaderError:
-            tags = ID3()
+        # One handle for both the tag read and the write.
+        with open(path, "r+b") as fh:
+            try:
+                tags = ID3(fh)
+            except ID3NoHeaderError:
+                tags = ID3()
+            artwork_embedded, changed = _fill_id3(tags, item, artwork)
+            # Retagging with identical values leaves the file untouched.
+            if changed:
+                tags.save(fh, v2_version=3, padding=_id3_padding)
+        return TagResult(artwork_embedded=artwork_embedded)
+    except Exception as e:  # noqa: BLE001
+        raise TagError(f"Failed to tag mp3: {e}", stage="Tagging") from e
 
-        if item.title:
-            tags.setall("TIT2", [TIT2(encoding=3, text=item.title)])
-        if item.artist:
-            tags.setall("TPE1", [TPE1(encoding=3, text=item.artist)])
-        album_title = _album_title(item)
-        if album_title:
-            tags.setall("TALB", [TALB(encoding=3, text=album_title)])
-        album_artist = _album_artist(item)
-        if album_artist:
-            tags.setall("TPE2", [TPE2(encoding=3, text=album_artist)])
-        if item.track_number is not None:
-            tags.setall("TRCK", [TRCK(encoding=3, text=str(item.track_number))])
-        if item.disc_number is not None:
-            tags.setall("TPOS", [TPOS(encoding=3, text=str(item.disc_number))])
-        if item.year is not None:
-            tags.setall("TDRC", [TDRC(encoding=3, text=str(item.year))])
 
-        note = _attribution_note(item.attribution)
-        if note:
+def _fill_id3(tags: Any, item: NormalizedItem, artwork: Artwork | None) -> tuple[bool, bool]:
+    """Apply ``item`` to ``tags``; returns (artwork_embedded, changed)."""
+    # Text frames are stored under their frame id alone, so assigning them
+    # replaces existing ones exactly like setall would.
+    frames: dict[str, Any] = {}
+    if item.title:
+        frames["TIT2"] = TIT2(encoding=3, text=item.title)
+    if item.artist:
+        frames["TPE1"] = TPE1(encoding=3, text=item.artist)
+    album_title = _album_title(item)
+    if album_title:
+        frames["TALB"] = TALB(encoding=3, text=album_title)
+    album_artist = _album_artist(item)
+    if album_artist:
+        frames["TPE2"] = TPE2(encoding=3, text=album_artist)
+    if item.track_number is not None:
+        frames["TRCK"] = TRCK(encoding=3, text=str(item.track_number))
+    if item.disc_number is not None:
+        frames["TPOS"] = TPOS(encoding=3, text=str(item.disc_number))
+    if item.year is not None:
+        frames["TDRC"] = TDRC(encoding=3, text=str(item.year))
+    changed = False
+    for key, frame in frames.items():
+        current = tags.get(key)
+        if current is None or current.text != frame.text:
+            tags[key] = frame
+            changed = True
+
+    note = _attribution_note(item.attribution)
+    if note:
+        comments = tags.getall("COMM")
+        if not (
+            len(comments) == 1
+            and comments[0].desc == "ripmedia"
+            and comments[0].lang == "eng"
+            and comments[0].text == [note]
+        ):
             tags.setall("COMM", [COMM(encoding=3, lang="eng", desc="ripmedia", text=note)])
-
-        artwork = _prepare_artwork(artwork, target="mp3")
-        artwork_embedded = False
-        if artwork:
+            changed = True
+
+    artwork = _prepare_artwork(artwork, target="mp3")
+    artwork_embedded = False
+    if artwork:
+        pictures = tags.getall("APIC")
+        if not (
+            len(pictures) == 1
+            and pictures[0].desc == "Cover"
+            and pictures[0].type == 3
+            and pictures[0].mime == artwork.mime
+            and pictures[0].data == artwork.bytes
+        ):
             tags.setall(
                 "APIC",
                 [
@@ -203,12 +477,9 @@ def _tag_mp3(path: Path, item: NormalizedItem, artwork: Artwork | None) -> TagRe
                     )
                 ],
             )
-            artwork_embedded = True
-
-        tags.save(path, v2_version=3)
-        return TagResult(artwork_embedded=artwork_embedded)
-    except Exception as e:  # noqa: BLE001
-        raise TagError(f"Failed to tag mp3: {e}", stage="Tagging") from e
+            changed = True
+        artwork_embedded = True
+    return artwork_embedded, changed
 
 
 def _tag_mp4(path: Path, item: NormalizedItem, artwork: Artwork | None) -> TagResult:
@@ -216,40 +487,50 @@ def _tag_mp4(path: Path, item: NormalizedItem, artwork: Artwork | None) -> TagRe
         from mutagen.mp4 import MP4, MP4Cover
 
         mp4 = MP4(path)
+        values: dict[str, list[Any]] = {}
         if item.title:
-            mp4["\xa9nam"] = [item.title]
+            values["\xa9nam"] = [item.title]
         if item.artist:
-            mp4["\xa9ART"] = [item.artist]
+            values["\xa9ART"] = [item.artist]
         album_title = _album_title(item)
         if album_title:
-            mp4["\xa9alb"] = [album_title]
+            values["\xa9alb"] = [album_title]
         album_artist = _album_artist(item)
         if album_artist:
-            mp4["aART"] = [album_artist]
+            values["aART"] = [album_artist]
         if item.track_number is not None:
-            mp4["trkn"] = [(item.track_number, 0)]
+            values["trkn"] = [(item.track_number, 0)]
         if item.disc_number is not None:
-            mp4["disk"] = [(item.disc_number, 0)]
+            values["disk"] = [(item.disc_number, 0)]
         if item.year is not None:
-            mp4["\xa9day"] = [str(item.year)]
+            values["\xa9day"] = [str(item.year)]
 
         note = _attribution_note(item.attribution)
         if note:
-            mp4["\xa9cmt"] = [note]
+            values["\xa9cmt"] = [note]
 
         artwork = _prepare_artwork(artwork, target="mp4")
         artwork_embedded = False
         if artwork:
             fmt = MP4Cover.FORMAT_PNG if artwork.mime == "image/png" else MP4Cover.FORMAT_JPEG
-            mp4["covr"] = [MP4Cover(artwork.bytes, imageformat=fmt)]
+            values["covr"] = [MP4Cover(artwork.bytes, imageformat=fmt)]
             artwork_embedded = True
 
-        mp4.save()
+        mp4.update(values)
+        mp4.save(padding=_mp4_padding)
         return TagResult(artwork_embedded=artwork_embedded)
     except Exception as e:  # noqa: BLE001
         raise TagError(f"Failed to tag mp4/m4a: {e}", stage="Tagging") from e
 
 
+# Suffix -> mutagen tagger; anything else is retagged through ffmpeg.
+_DISPATCH: dict[str, Callable[[Path, NormalizedItem, Artwork | None], TagResult]] = {
+    ".mp3": _tag_mp3,
+    ".m4a": _tag_mp4,
+    ".mp4": _tag_mp4,
+}
+
+
 def _tag_with_ffmpeg(path: Path, item: NormalizedItem) -> TagResult:
     metadata: list[tuple[str, str]] = []
     if item.title:
@@ -269,35 +550,51 @@ def _tag_with_ffmpeg(path: Path, item: NormalizedItem) -> TagResult:
     if item.year is not None:
         metadata.append(("date", str(item.year)))
 
-    if not metadata:
+    if not metadata or _tags_match(path, metadata):
         return TagResult(artwork_embedded=False)
 
-    args = ["ffmpeg", "-y", "-i", str(path), "-map", "0", "-c", "copy"]
+    ffmpeg = find_ffmpeg_tool("ffmpeg")
+    if ffmpeg is None:
+        raise TagError("ffmpeg not found. Install ffmpeg and ensure it's on PATH.", stage="Tagging")
+    args = [ffmpeg, "-y", "-i", str(path), "-map", "0", "-c", "copy"]
     for key, value in metadata:
         args.extend(["-metadata", f"{key}={value}"])
 
-    with tempfile.NamedTemporaryFile(delete=False, dir=path.parent, suffix=path.suffix) as tmp:
-        tmp_path = Path(tmp.name)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=path.suffix)
+    os.close(fd)
     try:
-        try:
-            proc = subprocess.run(
-                args + [str(tmp_path)],
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                check=False,
-            )
-        except FileNotFoundError as e:
-            raise TagError("ffmpeg not found. Install ffmpeg and ensure it's on PATH.", stage="Tagging") from e
+        proc = subprocess.run(
+            args + [tmp_name],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            check=False,
+        )
         if proc.returncode != 0:
             stderr = proc.stderr.strip() or "ffmpeg failed"
             raise TagError(f"Failed to tag via ffmpeg: {stderr}", stage="Tagging")
-        tmp_path.replace(path)
+        os.replace(tmp_name, path)
     finally:
-        if tmp_path.exists():
-            try:
-                tmp_path.unlink()
-            except Exception:  # noqa: BLE001
-                pass
+        try:
+            os.unlink(tmp_name)  # only still there if ffmpeg failed
+        except OSError:
+            pass
     return TagResult(artwork_embedded=False)
+
+
+# ffmpeg metadata keys as they end up in Vorbis comments (Ogg, Opus, FLAC).
+_VORBIS_KEYS = {"album_artist": "albumartist", "track": "tracknumber", "disc": "discnumber"}
+
+
+def _tags_match(path: Path, metadata: list[tuple[str, str]]) -> bool:
+    """Whether ``path`` already carries exactly these tags, so ffmpeg can be skipped."""
+    try:
+        from mutagen import File
+
+        tags = getattr(File(path), "tags", None)
+        if tags is None:
+            return False
+        return all(tags.get(_VORBIS_KEYS.get(key, key)) == [value] for key, value in metadata)
+    except Exception:  # noqa: BLE001
+        return False
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import math
+import os
+import threading
 from contextlib import contextmanager
-from dataclasses import dataclass
-from time import monotonic, sleep
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from time import monotonic
+from types import MappingProxyType
 from typing import Callable, Iterator
 
-from concurrent.futures import ThreadPoolExecutor
-
 from rich.console import Console
 from rich.console import Group
 from rich.live import Live
@@ -19,12 +23,27 @@ from rich.progress import (
 )
 from rich.spinner import Spinner
 from rich.text import Text
-from rich.markup import escape
 
 from .model import LogLevel
 from .shared import format_duration, format_speed
 
 
+# How often run_steps refreshes the spinner and estimated progress while a step runs.
+_STEP_TICK_SECONDS = 0.2
+
+_STAGE_STYLES = MappingProxyType(
+    {
+        "Detected": "bold cyan",
+        "Resolve": "bold magenta",
+        "Downloading": "bold cyan",
+        "Post-process": "bold cyan",
+        "Tagging": "bold cyan",
+        "Saved": "bold green",
+        "Update": "bold cyan",
+    }
+)
+
+
 @dataclass
 class Ui:
     console: Console
@@ -32,31 +51,34 @@ class Ui:
     print_path_only: bool = False
     plain_paths: bool = False
     speed_unit: str = "MBps"
+    # Progress columns are stateless between renders, so one set per layout is reused.
+    _column_cache: dict[tuple, tuple[ProgressColumn, ...]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # Output switches derived once from level/print_path_only, which don't change later.
+    _muted: bool = field(init=False, repr=False)
+    _verbose: bool = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._muted = self.level == "quiet" or self.print_path_only
+        self._verbose = not self.print_path_only and self.level in ("verbose", "debug")
 
     def stage(self, label: str, detail: str | None = None) -> None:
-        if self.level == "quiet" or self.print_path_only:
+        if self._muted:
             return
-        style = {
-            "Detected": "bold cyan",
-            "Resolve": "bold magenta",
-            "Downloading": "bold cyan",
-            "Post-process": "bold cyan",
-            "Tagging": "bold cyan",
-            "Saved": "bold green",
-            "Update": "bold cyan",
-        }.get(label, "bold")
+        style = _STAGE_STYLES.get(label, "bold")
         if detail:
             self.console.print(f"[{style}]{label}[/] [dim]{detail}[/dim]")
         else:
             self.console.print(f"[{style}]{label}[/]")
 
     def info(self, message: str) -> None:
-        if self.level == "quiet" or self.print_path_only:
+        if self._muted:
             return
         self.console.print(message)
 
     def verbose(self, message: str) -> None:
-        if self.level not in ("verbose", "debug") or self.print_path_only:
+        if not self._verbose:
             return
         self.console.print(f"[dim]{message}[/dim]")
 
@@ -66,19 +88,19 @@ class Ui:
         self.console.print(f"[red]Error:[/red] {message}")
 
     def banner(self, title: str) -> None:
-        if self.level == "quiet" or self.print_path_only:
+        if self._muted:
             return
         line = "=" * len(title)
         self.console.print(f"[bold]{title}[/bold]")
         self.console.print(f"[dim]{line}[/dim]")
 
     def section(self, title: str) -> None:
-        if self.level == "quiet" or self.print_path_only:
+        if self._muted:
             return
         self.console.print(f"[bold]{title}[/bold]")
 
     def status(self, label: str, ok: bool, detail: str | None = None) -> None:
-        if self.level == "quiet" or self.print_path_only:
+        if self._muted:
             return
         badge = "[green]OK[/green]" if ok else "[red]FAIL[/red]"
         if detail:
@@ -86,18 +108,17 @@ class Ui:
         else:
             self.console.print(f"{badge} {label}")
 
-    def path_link(self, path: "Path") -> str:
+    def path_link(self, path: Path) -> str:
         if self.plain_paths:
             return str(path)
         try:
-            resolved = path.resolve()
-            target = resolved.parent.as_uri()
+            parent, target = _resolve_dir(path.parent)
         except Exception:  # noqa: BLE001
             return str(path)
-        return f"[link={target}]{resolved}[/link]"
+        return f"[link={target}]{parent / path.name}[/link]"
 
     def hint(self, header: str, steps: list[str]) -> None:
-        if self.level == "quiet" or self.print_path_only:
+        if self._muted:
             return
         self.console.print(f"[bold]{header}[/bold]")
         for idx, step in enumerate(steps, start=1):
@@ -105,7 +126,7 @@ class Ui:
 
     @contextmanager
     def spinner(self, label: str) -> Iterator[None]:
-        if self.level == "quiet" or self.print_path_only:
+        if self._muted:
             yield
             return
         spinner = Spinner("dots", text=Text(label))
@@ -120,8 +141,26 @@ class Ui:
         show_bytes: bool = False,
         show_speed: bool = False,
     ) -> Progress:
-        columns = []
-        columns.append(_CountColumn())
+        key = (show_description, show_bytes, show_speed, self.speed_unit)
+        columns = self._column_cache.get(key)
+        if columns is None:
+            columns = self._build_columns(
+                show_description=show_description, show_bytes=show_bytes, show_speed=show_speed
+            )
+            self._column_cache[key] = columns
+        return Progress(
+            *columns,
+            # TimeRemainingColumn caches renders by task id, so it can't be shared.
+            TimeRemainingColumn(),
+            console=self.console,
+            transient=transient,
+            disable=self._muted,
+        )
+
+    def _build_columns(
+        self, *, show_description: bool, show_bytes: bool, show_speed: bool
+    ) -> tuple[ProgressColumn, ...]:
+        columns: list[ProgressColumn] = [_CountColumn()]
         if show_description:
             columns.append(TextColumn("{task.description}"))
         columns.extend(
@@ -134,21 +173,22 @@ class Ui:
             columns.append(_BytesColumn())
         if show_speed:
             columns.append(_SpeedColumn(self.speed_unit))
-        columns.append(TimeRemainingColumn())
-        return Progress(
-            *columns,
-            console=self.console,
-            transient=transient,
-            disable=self.level == "quiet" or self.print_path_only,
-        )
+        return tuple(columns)
 
     def run_steps(
         self,
         steps: list[tuple[str, Callable[[], "StepResult"]]],
         *,
         show_description: bool = True,
+        running_label: Callable[[str], str] | None = None,
     ) -> list["StepResult"]:
-        if self.level == "quiet" or self.print_path_only:
+        """Run ``steps`` in order with a live spinner and a log line per finished step.
+
+        A step that sets ``duration_s`` itself (e.g. it ran in the background) keeps it.
+        ``running_label`` maps the current step's label to the spinner text, so callers
+        can name work running alongside it.
+        """
+        if self._muted:
             return [fn() for _, fn in steps]
 
         results: list[StepResult] = []
@@ -164,41 +204,65 @@ class Ui:
                 return max(5.0, sum(durations) / len(durations))
             return default_step_seconds
 
-        with ThreadPoolExecutor(max_workers=1) as executor, self.live_progress(
-            progress,
-            max_log_lines=6,
-        ) as live:
-            for label, fn in steps:
-                progress.update(task_id, description=label)
-                live.tick(label)
-
-                start = monotonic()
-                future = executor.submit(fn)
-                while not future.done():
-                    elapsed = monotonic() - start
+        # Steps run on the calling thread; one ticker thread animates the spinner and the
+        # estimated progress while each step runs. The lock keeps their UI updates apart.
+        lock = threading.Lock()
+        stop = threading.Event()
+        step_start: float | None = None
+        step_label = ""
+        last_percent = -1
+
+        def tick_running_step() -> None:
+            nonlocal last_percent
+            while not stop.wait(_STEP_TICK_SECONDS):
+                with lock:
+                    if step_start is None:
+                        continue
+                    elapsed = monotonic() - step_start
                     est = estimate_step_seconds()
                     fraction = min(0.95, elapsed / est) if est > 0 else 0.0
-                    progress.update(task_id, completed=completed + fraction)
-                    live.tick()
-                    sleep(0.2)
-
-                try:
-                    result = future.result()
-                except Exception as e:  # noqa: BLE001
-                    result = StepResult(label=label, ok=False, detail=str(e))
-
-                duration = monotonic() - start
-                durations.append(duration)
-                completed += 1.0
-                progress.update(task_id, completed=completed)
-                stamped = StepResult(
-                    label=label,
-                    ok=result.ok,
-                    detail=result.detail,
-                    duration_s=duration,
-                )
-                results.append(stamped)
-                live.add_result(stamped)
+                    percent = int(fraction * 100)
+                    if percent != last_percent:
+                        last_percent = percent
+                        progress.update(task_id, completed=completed + fraction)
+                    live.tick(running_label(step_label) if running_label else None)
+
+        with self.live_progress(progress, max_log_lines=6) as live:
+            ticker = threading.Thread(target=tick_running_step, name="ripmedia-steps", daemon=True)
+            ticker.start()
+            try:
+                for label, fn in steps:
+                    with lock:
+                        progress.update(task_id, description=label)
+                        step_label = label
+                        live.tick(running_label(label) if running_label else label)
+                        last_percent = -1
+                        step_start = start = monotonic()
+
+                    try:
+                        result = fn()
+                    except Exception as e:  # noqa: BLE001
+                        result = StepResult(label=label, ok=False, detail=str(e))
+
+                    with lock:
+                        step_start = None
+                        duration = result.duration_s
+                        if duration is None:
+                            duration = monotonic() - start
+                        durations.append(duration)
+                        completed += 1.0
+                        progress.update(task_id, completed=completed)
+                        stamped = StepResult(
+                            label=label,
+                            ok=result.ok,
+                            detail=result.detail,
+                            duration_s=duration,
+                        )
+                        results.append(stamped)
+                        live.add_result(stamped)
+            finally:
+                stop.set()
+                ticker.join()
 
             progress.update(task_id, completed=len(steps))
             live.clear_current()
@@ -209,6 +273,28 @@ class Ui:
         return LiveProgress(self, progress=progress, max_log_lines=max_log_lines)
 
 
+def _resolve_dir(directory: Path) -> tuple[Path, str]:
+    # Saved files mostly share a few output folders; resolve each folder once per run.
+    # The cache key is the absolute path plus the folder's identity, so a changed
+    # working directory, a folder created later or a re-pointed symlink resolve afresh.
+    absolute = directory.absolute()
+    try:
+        st = os.stat(absolute)
+    except OSError:
+        return _resolve_dir_uncached(absolute)
+    return _resolve_dir_cached(absolute, st.st_dev, st.st_ino)
+
+
+@lru_cache(maxsize=256)
+def _resolve_dir_cached(directory: Path, dev: int, ino: int) -> tuple[Path, str]:
+    return _resolve_dir_uncached(directory)
+
+
+def _resolve_dir_uncached(directory: Path) -> tuple[Path, str]:
+    resolved = directory.resolve()
+    return resolved, resolved.as_uri()
+
+
 @dataclass(frozen=True)
 class StepResult:
     label: str
@@ -218,30 +304,38 @@ class StepResult:
 
 
 def _format_step(step: StepResult) -> str:
-    badge = "[green]OK[/green]" if step.ok else "[red]FAIL[/red]"
+    # Durations are shown to the second, so steps that only differ below that share
+    # a cache entry.
+    seconds = None if step.duration_s is None else int(round(step.duration_s))
+    return _format_step_line(step.label, step.ok, step.detail, seconds)
+
+
+@lru_cache(maxsize=256)
+def _format_step_line(label: str, ok: bool, detail: str | None, seconds: int | None) -> str:
+    badge = "[green]OK[/green]" if ok else "[red]FAIL[/red]"
     extras: list[str] = []
-    if step.duration_s is not None:
-        extras.append(f"[dim]{format_duration(step.duration_s)}[/dim]")
-    if step.detail and (
-        not step.ok or step.detail.lower().startswith("skipped") or step.label.lower() == "saved"
-    ):
-        extras.append(f"[dim]{_shorten(step.detail, 60)}[/dim]")
+    if seconds is not None:
+        extras.append(f"[dim]{format_duration(seconds)}[/dim]")
+    if detail and (not ok or detail.lower().startswith("skipped") or label.lower() == "saved"):
+        extras.append(f"[dim]{_shorten(detail, 60)}[/dim]")
     extra_text = f" {' | '.join(extras)}" if extras else ""
-    label = _shorten(step.label, 48)
-    return f"{badge} {label}{extra_text}"
+    return f"{badge} {_shorten(label, 48)}{extra_text}"
+
+
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
+_BYTE_SCALES = (1.0, 1e3, 1e6, 1e9, 1e12)
 
 
 def _format_bytes_parts(value: float) -> tuple[str, str]:
     amount = float(value)
-    units = ["B", "KB", "MB", "GB", "TB"]
-    unit = units[0]
-    for unit in units:
-        if abs(amount) < 1000 or unit == units[-1]:
-            break
-        amount /= 1000.0
-    if unit == "B":
-        return f"{amount:.0f}", unit
-    return f"{amount:>5.1f}", unit
+    if not math.isfinite(amount):
+        # yt-dlp can report inf/NaN sizes; like any oversized value they land on TB.
+        return f"{amount:>5.1f}", _BYTE_UNITS[-1]
+    # One unit step per three integer digits, capped at the largest unit.
+    idx = min((len(str(int(abs(amount)))) - 1) // 3, len(_BYTE_UNITS) - 1)
+    if idx == 0:
+        return f"{amount:.0f}", "B"
+    return f"{amount / _BYTE_SCALES[idx]:>5.1f}", _BYTE_UNITS[idx]
 
 
 def _shorten(text: str, max_len: int) -> str:
@@ -251,24 +345,43 @@ def _shorten(text: str, max_len: int) -> str:
 
 
 class _CountColumn(ProgressColumn):
+    # Columns remember their last rendering and reuse it while the inputs are unchanged.
+    def __init__(self) -> None:
+        super().__init__()
+        self._cache: tuple[tuple, Text] | None = None
+
     def render(self, task) -> Text:  # type: ignore[override]
         item_total = task.fields.get("item_total")
         if isinstance(item_total, int) and item_total > 0:
-            item_index = task.fields.get("item_index") or 0
-            return Text(f"({int(item_index)}/{int(item_total)})")
-
-        total = task.total
-        if total is None or total <= 0:
-            return Text("")
-        completed = int(task.completed)
-        total_i = int(total)
-        return Text(f"({completed}/{total_i})")
+            key = (int(task.fields.get("item_index") or 0), int(item_total))
+        elif task.total is None or task.total <= 0:
+            key = ()
+        else:
+            key = (int(task.completed), int(task.total))
+        cached = self._cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        text = Text(f"({key[0]}/{key[1]})") if key else Text("")
+        self._cache = (key, text)
+        return text
 
 
 class _BytesColumn(ProgressColumn):
+    def __init__(self) -> None:
+        super().__init__()
+        self._cache: tuple[tuple, Text] | None = None
+
     def render(self, task) -> Text:  # type: ignore[override]
-        total = task.total
-        completed = task.completed
+        key = (task.completed, task.total)
+        cached = self._cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        text = self._render_bytes(*key)
+        self._cache = (key, text)
+        return text
+
+    @staticmethod
+    def _render_bytes(completed: float | None, total: float | None) -> Text:
         if completed is None:
             return Text("")
         if total is None or total <= 0:
@@ -287,39 +400,90 @@ class _BytesColumn(ProgressColumn):
         return Text(text, style="progress.data.download")
 
 
+# Speeds in the same 0.05 Mb/s bucket format identically in both units, since every
+# rounding boundary of the one-decimal MB/s and Mb/s output is a multiple of it.
+_SPEED_BUCKET_BPS = 6250
+
+
 class _SpeedColumn(ProgressColumn):
     def __init__(self, unit: str) -> None:
         super().__init__()
         self._unit = unit
+        self._cache: tuple[int, Text] | None = None
 
     def render(self, task) -> Text:  # type: ignore[override]
         speed = task.speed
         if speed is None or speed <= 0:
             return Text("")
-        return Text(format_speed(speed, self._unit), style="progress.data.speed")
+        key = int(speed // _SPEED_BUCKET_BPS)
+        cached = self._cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        text = Text(format_speed(speed, self._unit), style="progress.data.speed")
+        self._cache = (key, text)
+        return text
 
 
-def _render_live(progress: Progress, log_lines: list[str], current_line: str) -> Group:
-    lines: list[Text] = []
-    if current_line:
-        lines.append(Text.from_markup(current_line))
-    if log_lines:
-        lines.extend(Text.from_markup(line) for line in log_lines)
+def _render_live(
+    progress: Progress, log_lines: list[Text], current_line: _RunningLine | None
+) -> Group:
+    lines: list[Text | _RunningLine] = []
+    if current_line is not None:
+        lines.append(current_line)
+    lines.extend(log_lines)
     if not lines:
         lines.append(Text(""))
     return Group(progress, *lines)
 
 
+_SPINNER_FRAMES = ("-", "\\", "|", "/")
+
+
+def _running_lines(frames: tuple[str, ...], label: str) -> tuple[Text, ...]:
+    # One prebuilt line per spinner frame; renders just pick the current one.
+    return tuple(Text.assemble((frame, "dim"), " Running: ", label) for frame in frames)
+
+
+# Spinner frames follow the clock, so background redraws animate it without ticks.
+_SPINNER_FPS = 8
+
+
+class _RunningLine:
+    __slots__ = ("_lines",)
+
+    def __init__(self, label: str) -> None:
+        self._lines = _running_lines(_SPINNER_FRAMES, label)
+
+    def frame(self) -> int:
+        return int(monotonic() * _SPINNER_FPS) % len(self._lines)
+
+    def __rich__(self) -> Text:
+        return self._lines[self.frame()]
+
+
+# Upper bound on redraws triggered by tick(); step results and clears always redraw.
+_MIN_REFRESH_INTERVAL = 1 / 30
+# Background redraw rate; keeps elapsed/ETA/speed columns and the spinner moving
+# through long steps (post-processing, tagging) that never tick.
+_AUTO_REFRESH_PER_SECOND = 4
+
+
 class LiveProgress:
     def __init__(self, ui: Ui, *, progress: Progress, max_log_lines: int = 6) -> None:
         self._ui = ui
         self._progress = progress
         self._max_log_lines = max_log_lines
-        self._log_lines: list[str] = []
-        self._current_line = ""
+        # Parsed once when added; log lines never change afterwards.
+        self._log_lines: list[Text] = []
+        self._current_line: _RunningLine | None = None
         self._label = ""
-        self._spinner_frames = ["-", "\\", "|", "/"]
+        self._running = _RunningLine(self._label)
+        # What the last tick saw; a tick only redraws when one of these moved.
+        self._frame = -1
+        self._progress_state: tuple[tuple[float, float | None], ...] = ()
         self._live: Live | None = None
+        self._dirty = True
+        self._last_refresh = 0.0
 
     @property
     def label(self) -> str:
@@ -333,33 +497,56 @@ class LiveProgress:
         self._live = Live(
             _render_live(self._progress, self._log_lines, self._current_line),
             console=self._ui.console,
-            refresh_per_second=12,
+            refresh_per_second=_AUTO_REFRESH_PER_SECOND,
         )
         self._live.__enter__()
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
         if self._live is not None:
+            self._refresh(force=True)
             self._live.__exit__(exc_type, exc, tb)
 
     def tick(self, label: str | None = None) -> None:
-        if label is not None:
+        if label is not None and label != self._label:
             self._label = label
-        spinner = self._spinner_frames[int(monotonic() * 10) % len(self._spinner_frames)]
-        safe_label = escape(self._label)
-        self._current_line = f"[dim]{spinner}[/dim] Running: {safe_label}"
+            self._running = _RunningLine(label)
+            self._current_line = self._running
+            self._dirty = True
+            # A new label often precedes a long step; show it now, not after the throttle.
+            self._refresh(force=True)
+            return
+        if self._current_line is None:
+            self._current_line = self._running
+            self._dirty = True
+        frame = self._running.frame()
+        progress_state = tuple((task.completed, task.total) for task in self._progress.tasks)
+        if frame != self._frame or progress_state != self._progress_state:
+            self._frame = frame
+            self._progress_state = progress_state
+            self._dirty = True
         self._refresh()
 
     def clear_current(self) -> None:
-        self._current_line = ""
-        self._refresh()
+        self._current_line = None
+        self._dirty = True
+        self._refresh(force=True)
 
     def add_result(self, result: StepResult) -> None:
-        self._log_lines.append(_format_step(result))
+        self._log_lines.append(Text.from_markup(_format_step(result)))
         if len(self._log_lines) > self._max_log_lines:
             del self._log_lines[:-self._max_log_lines]
-        self._refresh()
+        self._dirty = True
+        self._refresh(force=True)
 
-    def _refresh(self) -> None:
-        if self._live is not None:
-            self._live.update(_render_live(self._progress, self._log_lines, self._current_line))
+    def _refresh(self, *, force: bool = False) -> None:
+        if self._live is None or not self._dirty:
+            return
+        now = monotonic()
+        if not force and now - self._last_refresh < _MIN_REFRESH_INTERVAL:
+            return
+        self._dirty = False
+        self._last_refresh = now
+        self._live.update(
+            _render_live(self._progress, self._log_lines, self._current_line), refresh=True
+        )
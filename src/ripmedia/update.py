@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import platform
 import shutil
-import subprocess
 import sys
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from dataclasses import replace
 from pathlib import Path
 from time import monotonic
 
@@ -22,22 +26,28 @@ def run_update(
 ) -> int:
     root = _find_repo_root()
 
-    steps: list[tuple[str, callable]] = []
+    # Steps within a chain run in order (the pip steps share site-packages); separate
+    # chains run concurrently.
+    pip_chain: list[_Step] = []
     if git_pull:
         if update_from_github:
-            steps.append(("Git pull", lambda: _run_git_pull(ui, root)))
+            pip_chain.append(("Git pull", lambda: _run_git_pull(ui, root)))
         else:
-            steps.append(("Git pull", _skip_git_pull))
-    steps.append(
+            pip_chain.append(("Git pull", _skip_git_pull))
+    pip_chain.append(
         (
             "Python package",
             lambda: _update_python_packages(root, update_from_github=update_from_github),
         )
     )
-    steps.append(("yt-dlp", _update_ytdlp))
-    steps.append(("System deps", lambda: _ensure_system_deps(install_system=install_system)))
+    pip_chain.append(("yt-dlp", _update_ytdlp))
+    system_chain: list[_Step] = [
+        ("System deps", lambda: _ensure_system_deps(install_system=install_system))
+    ]
     start = monotonic()
-    results = ui.run_steps(steps, show_description=False)
+    chains = _Chains([pip_chain, system_chain])
+    steps = [(label, chains.futures[label].result) for label, _ in pip_chain + system_chain]
+    results = ui.run_steps(steps, show_description=False, running_label=chains.running_label)
     elapsed = monotonic() - start
 
     all_ok = all(step.ok for step in results)
@@ -49,6 +59,49 @@ def run_update(
     return 1
 
 
+_Step = tuple[str, Callable[[], Awaitable[StepResult]]]
+
+
+class _Chains:
+    """Run step chains concurrently on a background event loop.
+
+    ``futures`` holds one future per step label so the UI can wait for each step in its
+    own order. Results carry the step's own run time, not the time the UI waited.
+    """
+
+    def __init__(self, chains: list[list[_Step]]) -> None:
+        self.futures: dict[str, Future[StepResult]] = {
+            label: Future() for chain in chains for label, _ in chain
+        }
+        # Labels of the steps currently executing, in start order. Replaced wholesale on
+        # the loop thread, so the UI thread can read it without locking.
+        self._running: tuple[str, ...] = ()
+        threading.Thread(
+            target=asyncio.run, args=(self._run_all(chains),), name="ripmedia-update", daemon=True
+        ).start()
+
+    def running_label(self, label: str) -> str:
+        others = [other for other in self._running if other != label]
+        if not others:
+            return label
+        return f"{label} (also {', '.join(others)})"
+
+    async def _run_all(self, chains: list[list[_Step]]) -> None:
+        await asyncio.gather(*(self._run_chain(chain) for chain in chains))
+
+    async def _run_chain(self, chain: list[_Step]) -> None:
+        for label, step in chain:
+            self._running = self._running + (label,)
+            start = monotonic()
+            try:
+                result = await step()
+            except Exception as e:  # noqa: BLE001
+                result = StepResult(label, False, str(e))
+            finally:
+                self._running = tuple(other for other in self._running if other != label)
+            self.futures[label].set_result(replace(result, duration_s=monotonic() - start))
+
+
 def _find_repo_root() -> Path | None:
     here = Path(__file__).resolve()
     for parent in [here.parent] + list(here.parents):
@@ -57,39 +110,39 @@ def _find_repo_root() -> Path | None:
     return None
 
 
-def _run_git_pull(ui: Ui, root: Path | None) -> StepResult:
+async def _run_git_pull(ui: Ui, root: Path | None) -> StepResult:
     if root is None:
         return StepResult("Git pull", True, "skipped (no repo)")
     if not (root / ".git").exists():
         return StepResult("Git pull", True, "skipped (no .git)")
     if not _which("git"):
         return StepResult("Git pull", True, "skipped (git not found)")
-    ok, detail = _run_cmd(["git", "-C", str(root), "pull", "--ff-only"])
+    ok, detail = await _run_cmd(["git", "-C", str(root), "pull", "--ff-only"])
     return StepResult("Git pull", ok, detail)
 
 
-def _skip_git_pull() -> StepResult:
+async def _skip_git_pull() -> StepResult:
     return StepResult("Git pull", True, "skipped (github updates disabled)")
 
 
-def _update_python_packages(root: Path | None, *, update_from_github: bool) -> StepResult:
+async def _update_python_packages(root: Path | None, *, update_from_github: bool) -> StepResult:
     if root:
-        ok, detail = _run_cmd([sys.executable, "-m", "pip", "install", "-e", str(root)])
+        ok, detail = await _run_cmd([sys.executable, "-m", "pip", "install", "-e", str(root)])
         return StepResult("Python package", ok, detail)
 
     if not update_from_github:
         return StepResult("Python package", True, "skipped (github updates disabled)")
 
-    ok, detail = _run_cmd([sys.executable, "-m", "pip", "install", "-U", _GITHUB_INSTALL_URL])
+    ok, detail = await _run_cmd([sys.executable, "-m", "pip", "install", "-U", _GITHUB_INSTALL_URL])
     return StepResult("Python package", ok, detail)
 
 
-def _update_ytdlp() -> StepResult:
-    ok, detail = _run_cmd([sys.executable, "-m", "pip", "install", "-U", "yt-dlp"])
+async def _update_ytdlp() -> StepResult:
+    ok, detail = await _run_cmd([sys.executable, "-m", "pip", "install", "-U", "yt-dlp"])
     return StepResult("yt-dlp", ok, detail)
 
 
-def _ensure_system_deps(*, install_system: bool) -> StepResult:
+async def _ensure_system_deps(*, install_system: bool) -> StepResult:
     missing: list[str] = []
     if not _which("ffmpeg"):
         missing.append("ffmpeg")
@@ -115,7 +168,7 @@ def _ensure_system_deps(*, install_system: bool) -> StepResult:
     installed: list[str] = []
     failed: list[str] = []
     if "ffmpeg" in missing:
-        ff_ok, _ = _run_cmd(
+        ff_ok, _ = await _run_cmd(
             [
                 "winget",
                 "install",
@@ -132,7 +185,7 @@ def _ensure_system_deps(*, install_system: bool) -> StepResult:
             failed.append("ffmpeg")
         ok = ok and ff_ok
     if "js_runtime" in missing:
-        deno_ok, _ = _run_cmd(
+        deno_ok, _ = await _run_cmd(
             [
                 "winget",
                 "install",
@@ -144,7 +197,7 @@ def _ensure_system_deps(*, install_system: bool) -> StepResult:
             ],
         )
         if not deno_ok:
-            deno_ok, _ = _run_cmd(
+            deno_ok, _ = await _run_cmd(
                 [
                     "winget",
                     "install",
@@ -187,15 +240,38 @@ def _which(cmd: str) -> bool:
     return shutil.which(cmd) is not None
 
 
-def _run_cmd(cmd: list[str]) -> tuple[bool, str | None]:
+async def _run_cmd(cmd: list[str]) -> tuple[bool, str | None]:
     try:
-        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        # Only the last line of each stream is reported, so don't buffer the rest.
+        last_out, last_err = await asyncio.gather(
+            _last_line(proc.stdout), _last_line(proc.stderr)
+        )
+        returncode = await proc.wait()
     except Exception as e:  # noqa: BLE001
         return False, str(e)
-    if proc.returncode != 0:
-        stderr = (proc.stderr or "").strip()
-        return False, stderr.splitlines()[-1] if stderr else "command failed"
-    if proc.stdout:
-        last_line = proc.stdout.strip().splitlines()[-1]
-        return True, last_line if last_line else None
-    return True, None
+    if returncode != 0:
+        return False, last_err or "command failed"
+    return True, last_out
+
+
+async def _last_line(stream: asyncio.StreamReader | None) -> str | None:
+    if stream is None:
+        return None
+    last = b""
+    while True:
+        try:
+            line = await stream.readline()
+        except ValueError:
+            # Over-long line; readline() already discarded it.
+            continue
+        if not line:
+            break
+        line = line.strip()
+        if line:
+            last = line
+    return last.decode(errors="replace") if last else None
@@ -1,51 +1,89 @@
 from __future__ import annotations
 
+import os
 import re
+import stat
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from urllib.parse import urlparse, urlunparse
 
+_TWITTER_HOSTS = frozenset(
+    {
+        "twitter.com",
+        "www.twitter.com",
+        "mobile.twitter.com",
+        "x.com",
+        "www.x.com",
+        "mobile.x.com",
+    }
+)
 
-_TWITTER_HOSTS = {
-    "twitter.com",
-    "www.twitter.com",
-    "mobile.twitter.com",
-    "x.com",
-    "www.x.com",
-    "mobile.x.com",
-}
+# Arguments starting with these are URLs and never need a filesystem check.
+_URL_PREFIXES = ("http://", "https://", "ftp://")
+
+_TWITTER_STATUS_RE = re.compile(r"/(?:i/)?status/(\d+)")
+# Lines of a newline-joined URL batch that could be Twitter links.
+_TWITTER_LINE_RE = re.compile(r"^.*(?:twitter\.com|x\.com).*$", re.MULTILINE | re.IGNORECASE)
 
 
 def expand_url_args(args: list[str]) -> list[str]:
-    urls: list[str] = []
+    return normalize_urls(_iter_url_args(args))
+
+
+def _iter_url_args(args: list[str]) -> Iterator[str]:
     for arg in args:
-        path = Path(arg)
-        if path.exists() and path.is_file():
-            urls.extend(_read_urls_file(path))
+        if arg.startswith(_URL_PREFIXES):
+            yield arg
+            continue
+        try:
+            is_file = stat.S_ISREG(os.stat(arg).st_mode)
+        except (OSError, ValueError):
+            is_file = False
+        if is_file:
+            yield from _read_urls_file(Path(arg))
         else:
-            urls.append(arg)
-    return [normalize_url(u) for u in urls]
+            yield arg
 
 
-def _read_urls_file(path: Path) -> list[str]:
-    urls: list[str] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        urls.append(line)
-    return urls
+def _read_urls_file(path: Path) -> Iterator[str]:
+    with path.open("r", encoding="utf-8", buffering=1 << 16) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            yield line
+
+
+def normalize_urls(urls: Iterable[str]) -> list[str]:
+    """Normalize a batch of URLs, parsing only the ones that mention a Twitter host."""
+    out = [str(u).strip() for u in urls]
+    joined = "\n".join(out)
+    if joined.count("\n") != len(out) - 1:
+        # Embedded newlines would throw off the line numbering below.
+        return [normalize_url(u) for u in out]
+    line = 0
+    pos = 0
+    for match in _TWITTER_LINE_RE.finditer(joined):
+        line += joined.count("\n", pos, match.start())
+        pos = match.start()
+        out[line] = normalize_url(out[line])
+    return out
 
 
 def normalize_url(url: str) -> str:
     raw = str(url).strip()
     if not raw:
         return raw
+    # Every Twitter host contains one of these; skip parsing anything else.
+    low = raw.lower()
+    if "twitter.com" not in low and "x.com" not in low:
+        return raw
     parsed = urlparse(raw)
-    host = (parsed.hostname or "").lower()
+    host = parsed.netloc.lower()
+    if "@" in host or ":" in host:
+        host = host.rpartition("@")[2].partition(":")[0]
     if host in _TWITTER_HOSTS:
-        match = re.search(r"/status/(\d+)", parsed.path or "")
-        if not match:
-            match = re.search(r"/i/status/(\d+)", parsed.path or "")
+        match = _TWITTER_STATUS_RE.search(parsed.path or "")
         if match:
             status_id = match.group(1)
             return f"https://twitter.com/i/status/{status_id}"
@@ -369,6 +369,10 @@ function handleMessage(msg) {
     upsertItem(msg.item);
     return;
   }
+  if (msg.type === "queued_batch") {
+    (msg.items || []).forEach(upsertItem);
+    return;
+  }
   const node = items.get(msg.id);
   if (!node) {
     upsertItem({ id: msg.id, url: msg.url || "", status: "queued" });
@@ -1,23 +1,31 @@
 from __future__ import annotations
 
+import asyncio
 import io
 import json
-import queue
+import os
+import socket
 import sys
 import threading
 import webbrowser
+from collections import deque
 from dataclasses import dataclass, field
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import ThreadPoolExecutor
 from itertools import count
 from pathlib import Path
 from time import monotonic
 from typing import Any
 
 from importlib import resources
-from concurrent.futures import ThreadPoolExecutor
 
 from rich.console import Console
 
+try:
+    import orjson as _orjson
+except ImportError:  # optional: falls back to the stdlib encoder
+    _orjson = None
+
 from .errors import RipmediaError
 from .model import NormalizedItem
 from .pipeline import run_download
@@ -54,61 +62,226 @@ class ItemState:
     paths: list[str] = field(default_factory=list)
     error: str | None = None
     updated_at: float = field(default_factory=monotonic)
+    # Guards this item's fields; the manager lock only covers the items dict.
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _last_progress_publish: float = field(default=0.0, init=False, repr=False)
+
+
+# Minimum spacing of progress events for one item (10 per second).
+_PROGRESS_PUBLISH_INTERVAL = 0.1
+
+# Events kept per SSE client; a stalled client drops its oldest events instead of
+# growing without bound.
+_SUBSCRIBER_BACKLOG = 1024
+
+
+@dataclass(slots=True, eq=False)
+class Subscriber:
+    """One SSE client's pending events, consumed on the SSE event loop."""
+
+    loop: asyncio.AbstractEventLoop
+    events: deque[bytes] = field(default_factory=lambda: deque(maxlen=_SUBSCRIBER_BACKLOG))
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+    _wake_pending: bool = field(default=False, init=False)
+
+    def push(self, message: bytes) -> None:
+        # Called from download threads; only one wake-up is scheduled per drain.
+        self.events.append(message)
+        if not self._wake_pending:
+            self._wake_pending = True
+            self.loop.call_soon_threadsafe(self._wake)
+
+    def _wake(self) -> None:
+        self._wake_pending = False
+        self.wakeup.set()
+
+    async def drain(self) -> list[bytes]:
+        """Return every pending event, waiting for one if there are none."""
+        self.wakeup.clear()
+        if not self.events:
+            await self.wakeup.wait()
+        batch: list[bytes] = []
+        popleft = self.events.popleft
+        try:
+            while True:
+                batch.append(popleft())
+        except IndexError:
+            pass
+        return batch
 
 
 class EventBroker:
     def __init__(self) -> None:
-        self._subscribers: set[queue.Queue[str]] = set()
+        # Replaced wholesale under the lock on (rare) subscribe/unsubscribe, so publish
+        # can read it without locking.
+        self._subscribers: tuple[Subscriber, ...] = ()
         self._lock = threading.Lock()
 
-    def subscribe(self) -> queue.Queue[str]:
-        q: queue.Queue[str] = queue.Queue()
+    def subscribe(self, loop: asyncio.AbstractEventLoop) -> Subscriber:
+        sub = Subscriber(loop)
         with self._lock:
-            self._subscribers.add(q)
-        return q
+            self._subscribers = self._subscribers + (sub,)
+        return sub
 
-    def unsubscribe(self, q: queue.Queue[str]) -> None:
+    def unsubscribe(self, sub: Subscriber) -> None:
         with self._lock:
-            self._subscribers.discard(q)
+            self._subscribers = tuple(s for s in self._subscribers if s is not sub)
 
     def publish(self, payload: dict[str, Any]) -> None:
-        message = f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
-        with self._lock:
-            subscribers = list(self._subscribers)
-        for q in subscribers:
-            try:
-                q.put_nowait(message)
-            except Exception:
-                continue
+        if not self._subscribers:
+            return
+        # Encoded once here; SSE handlers write the bytes as-is.
+        self.publish_raw(b"data: " + _json_bytes(payload) + b"\n\n")
+
+    def publish_raw(self, message: bytes) -> None:
+        for sub in self._subscribers:
+            sub.push(message)
+
+
+_HEARTBEAT = b": ping\n\n"
+_HEARTBEAT_SECONDS = 10
+
+
+class SseHub:
+    """Serves every /events stream from a single asyncio loop thread.
+
+    The HTTP handler sends the response headers and hands the socket over, so SSE
+    clients don't each hold a server thread while they wait for events.
+    """
+
+    def __init__(self, broker: EventBroker) -> None:
+        self._broker = broker
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="ripmedia-sse", daemon=True).start()
+        asyncio.run_coroutine_threadsafe(self._heartbeat(), self._loop)
+
+    def attach(self, sock: socket.socket) -> None:
+        asyncio.run_coroutine_threadsafe(self._stream(sock), self._loop)
+
+    def close(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+    async def _heartbeat(self) -> None:
+        # One shared keep-alive for every client; dead connections fail on the write.
+        while True:
+            await asyncio.sleep(_HEARTBEAT_SECONDS)
+            self._broker.publish_raw(_HEARTBEAT)
+
+    async def _stream(self, sock: socket.socket) -> None:
+        sub = self._broker.subscribe(self._loop)
+        writer: asyncio.StreamWriter | None = None
+        try:
+            _, writer = await asyncio.open_connection(sock=sock)
+            while True:
+                batch = await sub.drain()
+                # Every pending frame goes out in one call; on Python 3.12+ this is a
+                # single sendmsg() over the frames without joining them first.
+                writer.writelines(batch)
+                await writer.drain()
+        except OSError:
+            pass
+        finally:
+            self._broker.unsubscribe(sub)
+            if writer is not None:
+                writer.close()
+            else:
+                sock.close()
 
 
 class DownloadManager:
     def __init__(self, *, broker: EventBroker, settings: WebSettings, parallel: int) -> None:
         self._broker = broker
         self._settings = settings
-        self._executor = ThreadPoolExecutor(max_workers=max(1, parallel))
+        # Long-lived workers pull (item_id, url) jobs; enqueue never allocates futures.
+        self._jobs: deque[tuple[str, str]] = deque()
+        self._jobs_cv = threading.Condition()
+        self._closed = False
+        # URL expansion runs off the request thread; one worker keeps submissions in order.
+        self._expander = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ripmedia-expand")
         self._items: dict[str, ItemState] = {}
+        # Only guards inserts into _items; item fields use each item's own lock.
         self._lock = threading.Lock()
         self._id_counter = count(1)
+        # Encoded /state body, rebuilt only after an item changes.
+        self._snapshot_cache: bytes | None = None
+        self._snapshot_dirty = True
+        self._snapshot_lock = threading.Lock()
+        self._workers = [
+            threading.Thread(target=self._work, name=f"ripmedia-web-{idx}", daemon=True)
+            for idx in range(1, max(1, parallel) + 1)
+        ]
+        for worker in self._workers:
+            worker.start()
 
     def enqueue(self, urls: list[str]) -> list[ItemState]:
-        items: list[ItemState] = []
-        for url in urls:
-            item_id = str(next(self._id_counter))
-            state = ItemState(id=item_id, url=url)
-            with self._lock:
-                self._items[item_id] = state
-            items.append(state)
-            self._broker.publish({"type": "queued", "item": self._serialize(state)})
-            self._executor.submit(self._run, item_id, url)
+        items = [ItemState(id=str(next(self._id_counter)), url=url) for url in urls]
+        if not items:
+            return items
+        # Serialized before any worker can see the items, so no item locks are needed.
+        serialized = [self._serialize(state) for state in items]
+        with self._lock:
+            self._items.update((state.id, state) for state in items)
+        self._snapshot_dirty = True
+        self._broker.publish({"type": "queued_batch", "items": serialized})
+        with self._jobs_cv:
+            self._jobs.extend((state.id, state.url) for state in items)
+            self._jobs_cv.notify(len(items))
         return items
 
+    def enqueue_args(self, args: list[str]) -> None:
+        """Expand ``args`` (URLs or URL files) in the background, then enqueue them."""
+        self._expander.submit(self._expand_and_enqueue, args)
+
+    def _expand_and_enqueue(self, args: list[str]) -> None:
+        try:
+            urls = expand_url_args(args)
+        except Exception:  # noqa: BLE001
+            # Unreadable URL files etc.: queue the raw args so each one reports its error.
+            urls = args
+        self.enqueue(urls)
+
     def shutdown(self) -> None:
-        self._executor.shutdown(wait=False, cancel_futures=False)
+        self._expander.shutdown(wait=False)
+        # Workers finish the jobs already queued and then exit; nothing waits for them.
+        with self._jobs_cv:
+            self._closed = True
+            self._jobs_cv.notify_all()
+
+    def _work(self) -> None:
+        # One quiet Ui per worker thread, reused for every download it runs.
+        ui = Ui(
+            console=Console(
+                file=_NullWriter(), quiet=True, no_color=True, highlight=False, soft_wrap=True
+            ),
+            level="quiet",
+            plain_paths=True,
+            speed_unit=self._settings.speed_unit,
+        )
+        while True:
+            with self._jobs_cv:
+                while not self._jobs and not self._closed:
+                    self._jobs_cv.wait()
+                if not self._jobs:
+                    return
+                item_id, url = self._jobs.popleft()
+            self._run(item_id, url, ui)
 
     def snapshot(self) -> list[dict[str, Any]]:
         with self._lock:
-            return [self._serialize(item) for item in self._items.values()]
+            items = list(self._items.values())
+        serialized: list[dict[str, Any]] = []
+        for item in items:
+            with item._lock:
+                serialized.append(self._serialize(item))
+        return serialized
+
+    def snapshot_bytes(self) -> bytes:
+        with self._snapshot_lock:
+            if self._snapshot_dirty or self._snapshot_cache is None:
+                # Cleared before the walk, so changes made during it mark it dirty again.
+                self._snapshot_dirty = False
+                self._snapshot_cache = _json_bytes({"items": self.snapshot()})
+            return self._snapshot_cache
 
     def _serialize(self, item: ItemState) -> dict[str, Any]:
         return {
@@ -119,44 +292,46 @@ class DownloadManager:
             "provider": item.provider,
             "kind": item.kind,
             "current": item.current,
-            "progress": item.progress,
-            "steps": item.steps,
-            "paths": item.paths,
+            # Copied so snapshots don't change as the item keeps updating in place.
+            "progress": dict(item.progress),
+            "steps": dict(item.steps),
+            "paths": list(item.paths),
             "error": item.error,
             "updated_at": item.updated_at,
         }
 
     def _update(self, item_id: str, **changes: Any) -> ItemState | None:
-        with self._lock:
-            item = self._items.get(item_id)
-            if not item:
-                return None
+        item = self._items.get(item_id)
+        if not item:
+            return None
+        with item._lock:
             for key, value in changes.items():
                 setattr(item, key, value)
             item.updated_at = monotonic()
-            return item
+        self._snapshot_dirty = True
+        return item
 
     def _record_step(self, item_id: str, step: StepResult) -> None:
         payload = {"ok": step.ok, "detail": step.detail, "duration": step.duration_s}
-        with self._lock:
-            item = self._items.get(item_id)
-            if not item:
-                return
-            steps = dict(item.steps)
-            steps[step.label] = payload
-            item.steps = steps
+        item = self._items.get(item_id)
+        if not item:
+            return
+        with item._lock:
+            item.steps[step.label] = payload
             item.updated_at = monotonic()
+        self._snapshot_dirty = True
         self._broker.publish({"type": "step", "id": item_id, "step": step.label, **payload})
 
     def _record_status(self, item_id: str, label: str) -> None:
-        with self._lock:
-            item = self._items.get(item_id)
-            if not item:
-                return
+        item = self._items.get(item_id)
+        if not item:
+            return
+        with item._lock:
             if item.status not in {"done", "error"}:
                 item.status = "running"
             item.current = label
             item.updated_at = monotonic()
+        self._snapshot_dirty = True
         self._broker.publish({"type": "status", "id": item_id, "label": label})
 
     def _record_progress(self, item_id: str, data: dict[str, Any]) -> None:
@@ -170,8 +345,17 @@ class DownloadManager:
                 data["speed_display"] = format_speed(speed_value, self._settings.speed_unit)
                 data["speed_unit"] = self._settings.speed_unit
         item = self._update(item_id, progress=data)
-        if item:
-            self._broker.publish({"type": "progress", "id": item_id, **data})
+        if not item:
+            return
+        # The state always keeps the latest values; events are capped per item, except
+        # the final update of a download.
+        now = monotonic()
+        downloaded, total = data.get("downloaded"), data.get("total")
+        finished = bool(total) and downloaded is not None and downloaded >= total
+        if not finished and now - item._last_progress_publish < _PROGRESS_PUBLISH_INTERVAL:
+            return
+        item._last_progress_publish = now
+        self._broker.publish({"type": "progress", "id": item_id, **data})
 
     def _record_metadata(self, item_id: str, item: NormalizedItem) -> None:
         title = item.title or item.url
@@ -183,13 +367,7 @@ class DownloadManager:
                 {"type": "meta", "id": item_id, "title": title, "provider": provider, "kind": kind}
             )
 
-    def _run(self, item_id: str, url: str) -> None:
-        ui = Ui(
-            console=Console(file=io.StringIO(), no_color=True, highlight=False, soft_wrap=True),
-            level="quiet",
-            plain_paths=True,
-            speed_unit=self._settings.speed_unit,
-        )
+    def _run(self, item_id: str, url: str, ui: Ui) -> None:
         start = monotonic()
         self._record_status(item_id, "Starting")
 
@@ -237,18 +415,21 @@ class DownloadManager:
             return
 
         duration = monotonic() - start
-        path_strings = []
-        for p in paths:
-            try:
-                path_strings.append(str(p.resolve()))
-            except Exception:
-                path_strings.append(str(p))
+        # abspath is pure string work; /open resolves the one path a user clicks.
+        path_strings = [os.path.abspath(p) for p in paths]
         self._update(item_id, status="done", paths=path_strings)
         self._broker.publish(
             {"type": "done", "id": item_id, "paths": path_strings, "duration": duration}
         )
 
 
+class _NullWriter(io.TextIOBase):
+    """Discards everything; worker consoles never keep their output around."""
+
+    def write(self, s: str) -> int:
+        return len(s)
+
+
 class WebHandler(BaseHTTPRequestHandler):
     server_version = "ripmedia"
 
@@ -268,12 +449,15 @@ class WebHandler(BaseHTTPRequestHandler):
             self.send_response(404)
             self.end_headers()
             return
-        body, mime = asset
-        self.send_response(200)
-        self.send_header("Content-Type", mime)
-        self.send_header("Content-Length", str(len(body)))
-        self.end_headers()
-        self.wfile.write(body)
+        # Status line and fixed headers were built at startup; only Date varies.
+        date = f"Date: {self.date_time_string()}\r\n\r\n".encode("ascii")
+        if asset.fd is not None:
+            # MSG_MORE holds the headers back so they leave in the same segment as the
+            # start of the body, which the kernel copies straight from the page cache.
+            self.connection.sendall(asset.head + date, _MSG_MORE)
+            _sendfile_all(self.connection, asset.fd, len(asset.body))
+            return
+        self.wfile.write(b"".join((asset.head, date, asset.body)))
 
     def do_POST(self) -> None:  # noqa: N802
         path = self.path.split("?", 1)[0]
@@ -287,33 +471,40 @@ class WebHandler(BaseHTTPRequestHandler):
 
     def _handle_enqueue(self) -> None:
         length = int(self.headers.get("Content-Length", "0"))
-        raw = self.rfile.read(length).decode("utf-8", errors="ignore")
         urls: list[str] = []
         if "application/json" in (self.headers.get("Content-Type") or ""):
             try:
-                payload = json.loads(raw)
+                payload = _json_loads(self.rfile.read(length))
                 urls = payload.get("urls", [])
             except json.JSONDecodeError:
                 urls = []
         else:
-            urls = [line.strip() for line in raw.splitlines() if line.strip()]
+            # Plain-text bodies are read line by line instead of as one big string.
+            remaining = length
+            while remaining > 0:
+                line = self.rfile.readline(remaining)
+                if not line:
+                    break
+                remaining -= len(line)
+                url = line.decode("utf-8", errors="ignore").strip()
+                if url:
+                    urls.append(url)
 
         urls = [u for u in urls if u]
         manager = self.server.manager  # type: ignore[attr-defined]
-        manager.enqueue(expand_url_args(urls))
-        resp = json.dumps({"queued": len(urls)})
+        manager.enqueue_args(urls)
+        resp = _json_bytes({"queued": len(urls)})
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(resp)))
         self.end_headers()
-        self.wfile.write(resp.encode("utf-8"))
+        self.wfile.write(resp)
 
     def _handle_open(self) -> None:
         length = int(self.headers.get("Content-Length", "0"))
-        raw = self.rfile.read(length).decode("utf-8", errors="ignore")
         target = None
         try:
-            payload = json.loads(raw)
+            payload = _json_loads(self.rfile.read(length))
             target = payload.get("path")
         except json.JSONDecodeError:
             target = None
@@ -336,40 +527,43 @@ class WebHandler(BaseHTTPRequestHandler):
 
     def _handle_state(self) -> None:
         manager = self.server.manager  # type: ignore[attr-defined]
-        payload = json.dumps({"items": manager.snapshot()})
+        payload = manager.snapshot_bytes()
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(payload)))
         self.end_headers()
-        self.wfile.write(payload.encode("utf-8"))
+        self.wfile.write(payload)
 
     def _handle_events(self) -> None:
-        broker: EventBroker = self.server.broker  # type: ignore[attr-defined]
+        hub: SseHub = self.server.sse_hub  # type: ignore[attr-defined]
         self.send_response(200)
         self.send_header("Content-Type", "text/event-stream")
         self.send_header("Cache-Control", "no-cache")
         self.send_header("Connection", "keep-alive")
         self.end_headers()
-        q = broker.subscribe()
-        try:
-            while True:
-                try:
-                    message = q.get(timeout=10)
-                    payload = message.encode("utf-8")
-                except queue.Empty:
-                    payload = b": ping\n\n"
-                try:
-                    self.wfile.write(payload)
-                    self.wfile.flush()
-                except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
-                    break
-        except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
-            pass
-        finally:
-            broker.unsubscribe(q)
+        self.close_connection = True
+        self.server.detach(self.connection)  # type: ignore[attr-defined]
+        hub.attach(self.connection)
 
 
 class QuietThreadingHTTPServer(ThreadingHTTPServer):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Sockets handed to the SSE hub; the server must not close them.
+        self._detached: set[socket.socket] = set()
+        self._detached_lock = threading.Lock()
+
+    def detach(self, request: socket.socket) -> None:
+        with self._detached_lock:
+            self._detached.add(request)
+
+    def shutdown_request(self, request):  # type: ignore[override]
+        with self._detached_lock:
+            if request in self._detached:
+                self._detached.discard(request)
+                return
+        super().shutdown_request(request)
+
     def handle_error(self, request, client_address):  # noqa: ARG002
         exc_type, exc, _ = sys.exc_info()
         if exc_type and issubclass(exc_type, (ConnectionAbortedError, ConnectionResetError, BrokenPipeError)):
@@ -385,13 +579,15 @@ def run_webhost(
     settings: WebSettings,
     open_browser: bool,
 ) -> None:
+    # Bind first: if the port is taken, nothing else has been started yet.
+    server = QuietThreadingHTTPServer((host, port), WebHandler)
     assets = _load_assets()
     broker = EventBroker()
     manager = DownloadManager(broker=broker, settings=settings, parallel=parallel)
 
-    server = QuietThreadingHTTPServer((host, port), WebHandler)
     server.assets = assets  # type: ignore[attr-defined]
     server.broker = broker  # type: ignore[attr-defined]
+    server.sse_hub = SseHub(broker)  # type: ignore[attr-defined]
     server.manager = manager  # type: ignore[attr-defined]
     server.settings = settings  # type: ignore[attr-defined]
     server.daemon_threads = True
@@ -404,21 +600,85 @@ def run_webhost(
         server.serve_forever()
     finally:
         server.server_close()
+        server.sse_hub.close()  # type: ignore[attr-defined]
+        _close_assets(assets)
         manager.shutdown()
 
 
-def _load_assets() -> dict[str, tuple[bytes, str]]:
+def _json_bytes(payload: Any) -> bytes:
+    if _orjson is not None:
+        return _orjson.dumps(payload, default=str)
+    return json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+
+
+# Assets are sent with os.sendfile where the headers can be corked onto the body
+# (Linux); everywhere else they are written from memory.
+_MSG_MORE = getattr(socket, "MSG_MORE", 0)
+_USE_SENDFILE = hasattr(os, "sendfile") and _MSG_MORE != 0
+
+
+@dataclass(frozen=True, slots=True)
+class _Asset:
+    head: bytes
+    body: bytes
+    fd: int | None = None
+
+
+def _json_loads(raw: bytes) -> Any:
+    if _orjson is not None:
+        try:
+            return _orjson.loads(raw)
+        except _orjson.JSONDecodeError:
+            pass  # e.g. invalid UTF-8; retry leniently below
+    return json.loads(raw.decode("utf-8", errors="ignore"))
+
+
+def _load_assets() -> dict[str, _Asset]:
     files = resources.files("ripmedia.web")
-    index = files.joinpath("index.html").read_text(encoding="utf-8")
-    css = files.joinpath("style.css").read_text(encoding="utf-8")
-    js = files.joinpath("app.js").read_text(encoding="utf-8")
     return {
-        "/index.html": (index.encode("utf-8"), "text/html; charset=utf-8"),
-        "/style.css": (css.encode("utf-8"), "text/css; charset=utf-8"),
-        "/app.js": (js.encode("utf-8"), "text/javascript; charset=utf-8"),
+        "/index.html": _make_asset(files.joinpath("index.html"), "text/html; charset=utf-8"),
+        "/style.css": _make_asset(files.joinpath("style.css"), "text/css; charset=utf-8"),
+        "/app.js": _make_asset(files.joinpath("app.js"), "text/javascript; charset=utf-8"),
     }
 
 
+def _make_asset(source: Any, mime: str) -> _Asset:
+    body = source.read_bytes()
+    head = (
+        f"{WebHandler.protocol_version} 200 OK\r\n"
+        f"Server: {WebHandler.server_version} {WebHandler.sys_version}\r\n"
+        f"Content-Type: {mime}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+    )
+    fd = None
+    if _USE_SENDFILE:
+        try:
+            with resources.as_file(source) as path:
+                # The descriptor stays valid even if as_file() used a temporary copy.
+                fd = os.open(path, os.O_RDONLY)
+            if os.fstat(fd).st_size != len(body):
+                os.close(fd)
+                fd = None
+        except OSError:
+            fd = None
+    return _Asset(head=head.encode("latin-1"), body=body, fd=fd)
+
+
+def _close_assets(assets: dict[str, _Asset]) -> None:
+    for asset in assets.values():
+        if asset.fd is not None:
+            os.close(asset.fd)
+
+
+def _sendfile_all(sock: socket.socket, fd: int, size: int) -> None:
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(sock.fileno(), fd, offset, size - offset)
+        if sent == 0:
+            raise BrokenPipeError("connection closed during sendfile")
+        offset += sent
+
+
 def _open_in_explorer(path: Path) -> None:
     open_with_default_app(path, reveal_parent=True)
 
@@ -1,12 +1,24 @@
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+
+# Any path separator marks a profile path; drive paths like C:\ contain one too.
+_PATH_RE = re.compile(r"[\\/]")
+
 
 def normalize_cookies_from_browser(value: str | None) -> tuple[str, ...] | None:
     if value is None:
         return None
     if isinstance(value, (list, tuple)):
         return tuple(str(v) for v in value if str(v))
-    raw = str(value).strip()
+    return _normalize_spec(str(value))
+
+
+@lru_cache(maxsize=128)
+def _normalize_spec(value: str) -> tuple[str, ...] | None:
+    # The same spec is normalized for every download in a session; parse it once.
+    raw = value.strip()
     if not raw or raw.lower() in {"none", "null", "false"}:
         return None
     parts = _split_spec(raw)
@@ -30,8 +42,11 @@ def _repair_windows_path_parts(parts: list[str]) -> list[str]:
     for idx in range(1, len(parts) - 1):
         head = parts[idx]
         tail = parts[idx + 1]
-        if len(head) == 1 and head.isalpha() and (tail.startswith("\\") or tail.startswith("/")):
-            return parts[:idx] + [":".join(parts[idx:])]
+        if len(head) == 1 and head.isalpha() and tail.startswith(("\\", "/")):
+            # Glue the drive letter back onto the rest of the path in place.
+            parts[idx] = ":".join(parts[idx:])
+            del parts[idx + 1 :]
+            return parts
     return parts
 
 
@@ -60,11 +75,7 @@ def _build_spec_tuple(parts: list[str]) -> tuple[str, ...]:
 
 
 def _looks_like_path(value: str) -> bool:
-    return (
-        "\\" in value
-        or "/" in value
-        or (len(value) > 2 and value[1:3] == ":\\" and value[0].isalpha())
-    )
+    return _PATH_RE.search(value) is not None
 
 
 def _join_path(base: str, leaf: str) -> str:
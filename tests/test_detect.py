@@ -19,3 +19,11 @@ def test_detect_spotify() -> None:
 
 def test_detect_pornhub() -> None:
     assert detect_provider("https://www.pornhub.com/view_video.php?viewkey=abc") == Provider.PORNHUB
+
+
+def test_detect_strips_mobile_prefixes() -> None:
+    assert detect_provider("https://m.youtube.com/watch?v=abc") == Provider.YOUTUBE
+    assert detect_provider("https://www.youtube-nocookie.com/embed/abc") == Provider.YOUTUBE
+    assert detect_provider("https://mobile.x.com/user/status/1") == Provider.TWITTER
+    assert detect_provider("https://m.soundcloud.com/user/track") == Provider.SOUNDCLOUD
+    assert detect_provider("https://example.com/video") == Provider.UNKNOWN
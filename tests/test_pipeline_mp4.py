@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import pytest
+
+from ripmedia import pipeline
+from ripmedia.errors import DownloadError
+from ripmedia.pipeline import _ensure_playable_mp4_many, _is_faststart
+
+
+def _box(kind: bytes, payload: bytes = b"") -> bytes:
+    return (8 + len(payload)).to_bytes(4, "big") + kind + payload
+
+
+def test_is_faststart_moov_before_mdat(tmp_path: Path) -> None:
+    path = tmp_path / "a.mp4"
+    path.write_bytes(_box(b"ftyp", b"isom") + _box(b"moov", b"x" * 16) + _box(b"mdat", b"y" * 32))
+    assert _is_faststart(path) is True
+
+
+def test_is_faststart_mdat_before_moov(tmp_path: Path) -> None:
+    path = tmp_path / "b.mp4"
+    path.write_bytes(_box(b"ftyp", b"isom") + _box(b"mdat", b"y" * 32) + _box(b"moov", b"x" * 16))
+    assert _is_faststart(path) is False
+
+
+def test_is_faststart_large_box(tmp_path: Path) -> None:
+    path = tmp_path / "c.mp4"
+    free = (1).to_bytes(4, "big") + b"free" + (24).to_bytes(8, "big") + b"z" * 8
+    path.write_bytes(_box(b"ftyp", b"isom") + free + _box(b"moov"))
+    assert _is_faststart(path) is True
+
+
+def test_is_faststart_truncated(tmp_path: Path) -> None:
+    path = tmp_path / "d.mp4"
+    path.write_bytes(b"\x00\x00")
+    assert _is_faststart(path) is False
+
+
+def test_ensure_playable_many_isolates_failed_item(monkeypatch: pytest.MonkeyPatch) -> None:
+    paths = [Path(f"{idx}.mp4") for idx in range(20)]
+    batches: list[int] = []
+    single: list[Path] = []
+
+    def remux_many(batch: list[Path], codec_args: tuple[str, ...]) -> None:
+        batches.append(len(batch))
+        if Path("3.mp4") in batch:
+            raise DownloadError("FFmpeg failed: bad input", stage="Post-process")
+
+    def faststart(path: Path) -> Path:
+        single.append(path)
+        if path == Path("3.mp4"):
+            raise OSError("disk full")
+        return path
+
+    monkeypatch.setattr(pipeline, "_needs_transcode", lambda path: False)
+    monkeypatch.setattr(pipeline, "_is_faststart", lambda path: False)
+    monkeypatch.setattr(pipeline, "_ffmpeg_remux_many", remux_many)
+    monkeypatch.setattr(pipeline, "_ffmpeg_faststart", faststart)
+
+    errors = _ensure_playable_mp4_many(paths)
+
+    assert batches == [16, 4]
+    assert single == paths[:16]
+    assert [idx for idx, e in enumerate(errors) if e is not None] == [3]
+    assert errors[3] is not None and errors[3].stage == "Post-process"
@@ -1,5 +1,5 @@
 from ripmedia.model import MediaKind, NormalizedItem, Provider
-from ripmedia.resolver import _score_candidate
+from ripmedia.resolver import _norm_text, _score_candidate
 
 
 def test_score_candidate_prefers_matching_artist() -> None:
@@ -16,5 +16,9 @@ def test_score_candidate_prefers_matching_artist() -> None:
     good = {"title": "Concernn - Tear Me Apart (Audio)", "channel": "Concernn", "duration": 181}
     bad = {"title": "Tear Me Apart", "channel": "RandomUploader", "duration": 180}
 
-    assert _score_candidate(item, good) > _score_candidate(item, bad)
+    exp_title = _norm_text(item.title or "")
+    exp_artist = _norm_text(item.artist or "")
+    good_score = _score_candidate(exp_title, exp_artist, item.duration_seconds, good, None)
+    bad_score = _score_candidate(exp_title, exp_artist, item.duration_seconds, bad, None)
+    assert good_score > bad_score
 
@@ -0,0 +1,29 @@
+from ripmedia.shared import format_duration, format_speed, sniff_image_mime
+
+
+def test_sniff_image_mime_known_signatures() -> None:
+    assert sniff_image_mime(b"\xff\xd8\xff\xe0" + b"\x00" * 16) == "image/jpeg"
+    assert sniff_image_mime(b"\x89PNG\r\n\x1a\n" + b"\x00" * 16) == "image/png"
+    assert sniff_image_mime(b"RIFF\x00\x00\x00\x00WEBPVP8 ") == "image/webp"
+    assert sniff_image_mime(b"GIF89a" + b"\x00" * 16) == "image/gif"
+
+
+def test_sniff_image_mime_rejects_other_data() -> None:
+    assert sniff_image_mime(b"") is None
+    assert sniff_image_mime(b"RIFF") is None
+    assert sniff_image_mime(b"RIFF\x00\x00\x00\x00WAVE") is None
+    assert sniff_image_mime(b"\xff\xfb\x90\x00") is None
+    assert sniff_image_mime(b"<html>") is None
+
+
+def test_format_duration() -> None:
+    assert format_duration(-3) == "00:00"
+    assert format_duration(59.6) == "01:00"
+    assert format_duration(125) == "02:05"
+    assert format_duration(3725.2) == "1:02:05"
+
+
+def test_format_speed_units() -> None:
+    assert format_speed(1_250_000, "Mbps") == " 10.0 Mb/s"
+    assert format_speed(1_250_000, "MBps") == "  1.2 MB/s"
+    assert format_speed(1_250_000, "unknown") == "  1.2 MB/s"
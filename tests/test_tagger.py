@@ -0,0 +1,74 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from ripmedia import tagger
+from ripmedia.errors import TagError
+from ripmedia.model import MediaKind, NormalizedItem, Provider
+from ripmedia.tagger import TagResult, tag_files
+
+
+def test_tag_files_keeps_other_results_when_one_raises(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fake_tag_file(path: Path, item: NormalizedItem, *, artwork_override=None) -> TagResult:
+        if path.name == "b.mp3":
+            raise OSError("ffmpeg vanished")
+        return TagResult(artwork_embedded=False)
+
+    monkeypatch.setattr(tagger, "tag_file", fake_tag_file)
+    item = NormalizedItem(
+        provider=Provider.YOUTUBE, kind=MediaKind.TRACK, id=None, url="https://x.test/"
+    )
+    jobs = [(Path(name), item, None) for name in ("a.mp3", "b.mp3", "c.mp3")]
+
+    results = tag_files(jobs)
+
+    assert results[0] == TagResult(artwork_embedded=False)
+    assert isinstance(results[1], TagError)
+    assert str(results[1]) == "ffmpeg vanished"
+    assert results[1].stage == "Tagging"
+    assert results[2] == TagResult(artwork_embedded=False)
+
+
+def test_artwork_disk_cache_round_trip_and_expiry(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    url = "https://i.test/cover.avif"
+    tagger._write_cached_artwork(url, b"\x00\x00\x00\x1cftypavif", "image/avif")
+
+    cached = tagger._read_cached_artwork(url)
+    assert cached == tagger.Artwork(bytes=b"\x00\x00\x00\x1cftypavif", mime="image/avif")
+
+    old = time.time() - tagger._ARTWORK_DISK_MAX_AGE_SECONDS - 60
+    os.utime(tagger._artwork_cache_path(url), (old, old))
+    assert tagger._read_cached_artwork(url) is None
+
+
+def test_prune_artwork_cache_drops_expired_stale_and_oldest(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(tagger, "_ARTWORK_DISK_MAX_BYTES", 250)
+    now = time.time()
+
+    def make(name: str, age: float, size: int = 100) -> Path:
+        path = tmp_path / name
+        path.write_bytes(b"x" * size)
+        os.utime(path, (now - age, now - age))
+        return path
+
+    newest = make("newest", 10)
+    newer = make("newer", 20)
+    oldest = make("oldest", 30)
+    expired = make("expired", tagger._ARTWORK_DISK_MAX_AGE_SECONDS + 60)
+    stale_tmp = make("a.1.2.tmp", tagger._ARTWORK_STALE_TMP_SECONDS + 60)
+    fresh_tmp = make("b.1.2.tmp", 1, size=10)
+
+    tagger._prune_artwork_cache.__wrapped__(tmp_path)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+        p.name for p in (newest, newer, fresh_tmp)
+    )
+    assert not oldest.exists() and not expired.exists() and not stale_tmp.exists()
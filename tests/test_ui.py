@@ -0,0 +1,79 @@
+import io
+from pathlib import Path
+
+from rich.console import Console
+from rich.live import Live
+from rich.progress import Progress
+
+from ripmedia import ui as ui_module
+from ripmedia.ui import LiveProgress, Ui, _format_bytes_parts, _resolve_dir
+
+
+def test_format_bytes_parts_picks_unit():
+    assert _format_bytes_parts(0) == ("0", "B")
+    assert _format_bytes_parts(999) == ("999", "B")
+    assert _format_bytes_parts(1000) == ("  1.0", "KB")
+    assert _format_bytes_parts(999_999.9) == ("1000.0", "KB")
+    assert _format_bytes_parts(5_500_000) == ("  5.5", "MB")
+    assert _format_bytes_parts(2.5e15) == ("2500.0", "TB")
+
+
+def test_format_bytes_parts_non_finite():
+    assert _format_bytes_parts(float("inf")) == ("  inf", "TB")
+    assert _format_bytes_parts(float("-inf")) == (" -inf", "TB")
+    assert _format_bytes_parts(float("nan")) == ("  nan", "TB")
+
+
+def test_live_progress_redraws_only_on_change(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(ui_module, "monotonic", lambda: clock[0])
+    updates = []
+    original_update = Live.update
+
+    def counting_update(self, renderable, *, refresh=False):
+        updates.append(renderable)
+        original_update(self, renderable, refresh=refresh)
+
+    monkeypatch.setattr(Live, "update", counting_update)
+    console = Console(file=io.StringIO(), force_terminal=True, width=80)
+    progress = Progress(console=console)
+    task_id = progress.add_task("download", total=10)
+    live = LiveProgress(Ui(console=console, level="normal"), progress=progress)
+    with live:
+        live.tick("Downloading")
+        # A new label redraws at once, even inside the throttle window.
+        live.tick("Tagging")
+        assert len(updates) == 2
+        clock[0] += 1.0
+        live.tick()
+        assert len(updates) == 3
+        # Same spinner frame and unchanged progress: nothing to redraw.
+        clock[0] += 1.0
+        live.tick()
+        assert len(updates) == 3
+        progress.advance(task_id)
+        clock[0] += 1.0
+        live.tick()
+        assert len(updates) == 4
+        clock[0] += 1 / 8
+        live.tick()
+        assert len(updates) == 5
+
+
+def test_resolve_dir_follows_cwd_and_new_links(tmp_path: Path, monkeypatch) -> None:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    for base in (first, second):
+        (base / "out").mkdir(parents=True)
+    monkeypatch.chdir(first)
+    assert _resolve_dir(Path("out"))[0] == (first / "out").resolve()
+    monkeypatch.chdir(second)
+    assert _resolve_dir(Path("out"))[0] == (second / "out").resolve()
+
+    link = tmp_path / "link"
+    assert _resolve_dir(link)[0] == link.resolve()
+    link.symlink_to(first / "out")
+    assert _resolve_dir(link)[0] == (first / "out").resolve()
+    link.unlink()
+    link.symlink_to(second / "out")
+    assert _resolve_dir(link)[0] == (second / "out").resolve()
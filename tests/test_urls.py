@@ -1,4 +1,4 @@
-from ripmedia.urls import normalize_url
+from ripmedia.urls import expand_url_args, normalize_url, normalize_urls
 
 
 def test_normalize_twitter_status_url():
@@ -14,3 +14,35 @@ def test_normalize_twitter_status_with_video_path():
 def test_normalize_non_twitter_url():
     url = "https://example.com/path?x=1"
     assert normalize_url(url) == url
+
+
+def test_normalize_twitter_i_status_and_profile_urls():
+    assert normalize_url("https://X.com/i/status/42") == "https://twitter.com/i/status/42"
+    assert normalize_url("http://mobile.twitter.com/user?s=20") == "https://twitter.com/user"
+
+
+def test_expand_url_args_reads_url_files(tmp_path):
+    urls_file = tmp_path / "urls.txt"
+    urls_file.write_text(
+        "# comment\r\nhttps://x.com/a/status/1\n\n  https://example.com/b  \n", encoding="utf-8"
+    )
+    assert expand_url_args(["https://example.com/a", str(urls_file)]) == [
+        "https://example.com/a",
+        "https://twitter.com/i/status/1",
+        "https://example.com/b",
+    ]
+
+
+def test_normalize_urls_matches_normalize_url():
+    urls = [
+        "https://youtu.be/abc",
+        " https://X.com/u/status/7?s=1 ",
+        "",
+        "https://twitter.com/user",
+        "https://soundcloud.com/a/b",
+    ]
+    assert normalize_urls(urls) == [normalize_url(u) for u in urls]
+    assert normalize_urls(["a\nb", "https://x.com/u/status/1"]) == [
+        "a\nb",
+        "https://twitter.com/i/status/1",
+    ]
@@ -0,0 +1,65 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from ripmedia import webhost
+from ripmedia.errors import DownloadError
+from ripmedia.webhost import DownloadManager, EventBroker, WebSettings
+
+
+def _settings(tmp_path: Path) -> WebSettings:
+    return WebSettings(
+        output_dir=tmp_path,
+        audio=False,
+        override_audio_format=None,
+        override_video_format=None,
+        resolver="auto",
+        interactive=False,
+        cookies=None,
+        cookies_from_browser=None,
+        prefer_mp3_mp4=False,
+        speed_unit="MBps",
+    )
+
+
+def _wait_finished(manager: DownloadManager, count: int) -> list[dict]:
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        items = manager.snapshot()
+        if len(items) == count and all(i["status"] in {"done", "error"} for i in items):
+            return items
+        time.sleep(0.01)
+    raise AssertionError(f"downloads did not finish: {manager.snapshot()}")
+
+
+def test_download_manager_runs_jobs_and_shuts_down(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fake_download(url: str, **kwargs) -> list[Path]:
+        if url.endswith("/bad"):
+            raise DownloadError("no formats", stage="Download")
+        return [tmp_path / f"{url.rsplit('/', 1)[1]}.mp3"]
+
+    monkeypatch.setattr(webhost, "run_download", fake_download)
+    urls_file = tmp_path / "urls.txt"
+    urls_file.write_text("https://a.test/1\n# comment\nhttps://a.test/bad\n", encoding="utf-8")
+
+    manager = DownloadManager(broker=EventBroker(), settings=_settings(tmp_path), parallel=2)
+    try:
+        manager.enqueue(["https://a.test/0"])
+        # Expanded on the background worker; the call itself returns right away.
+        manager.enqueue_args([str(urls_file)])
+        items = _wait_finished(manager, 3)
+    finally:
+        manager.shutdown()
+
+    by_url = {item["url"]: item for item in items}
+    assert list(by_url) == ["https://a.test/0", "https://a.test/1", "https://a.test/bad"]
+    assert by_url["https://a.test/1"]["status"] == "done"
+    assert by_url["https://a.test/1"]["paths"] == [str(tmp_path / "1.mp3")]
+    assert by_url["https://a.test/bad"]["status"] == "error"
+    assert by_url["https://a.test/bad"]["error"] == "no formats"
+    for worker in manager._workers:
+        worker.join(timeout=5)
+        assert not worker.is_alive()
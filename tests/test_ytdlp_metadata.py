@@ -0,0 +1,75 @@
+import threading
+from collections.abc import Iterator
+
+import pytest
+import yt_dlp
+
+from ripmedia.model import MediaKind, Provider
+from ripmedia.pipeline import _collection_total_label
+from ripmedia.providers.ytdlp_metadata import stream_ytdlp_metadata
+
+_URL = "https://youtube.com/playlist?list=x"
+
+
+class _FakeYoutubeDL:
+    pulled = 0
+    finished = threading.Event()
+
+    def __init__(self, opts: dict) -> None:
+        pass
+
+    def __enter__(self) -> "_FakeYoutubeDL":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        type(self).finished.set()
+
+    def extract_info(self, url: str, *, download: bool, process: bool) -> dict:
+        return {
+            "_type": "playlist",
+            "title": "Mix",
+            "playlist_count": 500,
+            "entries": self._entries(),
+        }
+
+    def _entries(self) -> Iterator[dict]:
+        for idx in range(1, 501):
+            type(self).pulled += 1
+            yield {
+                "url": f"https://www.youtube.com/watch?v={idx}",
+                "title": f"Video {idx}",
+                "thumbnails": [
+                    {"url": f"https://i.test/{idx}/small"},
+                    {"url": f"https://i.test/{idx}/big"},
+                ],
+            }
+
+
+@pytest.fixture
+def fake_ydl(monkeypatch: pytest.MonkeyPatch) -> type[_FakeYoutubeDL]:
+    _FakeYoutubeDL.pulled = 0
+    _FakeYoutubeDL.finished = threading.Event()
+    monkeypatch.setattr(yt_dlp, "YoutubeDL", _FakeYoutubeDL)
+    return _FakeYoutubeDL
+
+
+def test_stream_entries_keep_index_and_artwork(fake_ydl: type[_FakeYoutubeDL]) -> None:
+    item, entries = stream_ytdlp_metadata(_URL, provider=Provider.YOUTUBE)
+
+    assert item.kind == MediaKind.PLAYLIST
+    assert entries is not None
+    assert _collection_total_label(item, entries) == "500"
+    first = next(entries)
+    assert first.track_number == 1
+    assert first.artwork_url == "https://i.test/1/big"
+    entries.close()
+
+
+def test_stream_producer_stops_when_consumer_closes(fake_ydl: type[_FakeYoutubeDL]) -> None:
+    _, entries = stream_ytdlp_metadata(_URL, provider=Provider.YOUTUBE)
+    assert entries is not None
+    next(entries)
+    entries.close()
+
+    assert fake_ydl.finished.wait(5)
+    assert fake_ydl.pulled < 500